@@ -1,11 +1,12 @@
 import argparse
+import sys
 
 from pathlib import Path
 
-from convert import string_to_sequent
 from export_file import get_exporter
 from import_file import get_importer
 from prover import Prover
+from rules import RuleTable, SELECTION_STRATEGIES
 from settings import Settings
 
 solve_help = 'decompose sequents in infile and export the results to ' \
@@ -24,8 +25,23 @@ connective_help = '\'->\', \'implies\', \'if\',\'conditional\' ' \
 
 rule_help = 'display current rule settings'
 
+check_help = 'only print whether each sequent is provable, without ' \
+             'exporting its tree'
 
-def solve(infile, outfile, filetype) -> None:
+solve_rule_help = 'use VALUE for CONNECTIVE on SIDE for this run only, ' \
+                  'without changing the settings (may be repeated)'
+
+strategy_help = 'how to choose which proposition of a sequent to ' \
+                'decompose first (default: leftmost)'
+
+compress_help = 'apply each run of invertible one-parent rules in a ' \
+                'single step, making trees with fewer nodes'
+
+prune_help = 'leave out branches of multiplicative rules in which a ' \
+             'parent can\'t be closed'
+
+
+def solve(infile, outfile, filetype, prune=False, check=False, rules=None) -> None:
     # Create path for outfile if outfile is not specified
     if outfile is None:
         # Set outfile to infile plus _results
@@ -46,10 +62,21 @@ def solve(infile, outfile, filetype) -> None:
     data = importer.import_()
 
     # Solve sequents in file
-    roots = [string_to_sequent(s) for s in data['sequents']]
-    prover = Prover(roots=roots, names=data['names'])
+    # Sequents are parsed by the processes that prove them, and lines
+    # that can't be parsed are reported rather than stopping the run.
+    prover = Prover.from_lines(
+        data['sequents'], names=data['names'], prune=prune, check=check, rules=rules
+    )
     prover.run()
     result: dict = prover.export()
+    for line_number, message in prover.errors:
+        print(f'Skipped line {line_number}: {message}', file=sys.stderr)
+
+    # In check mode there are no trees to export, just answers
+    if check:
+        for root, provable in zip(result['sequents'], result['results']):
+            print(f'{root}\t{provable}')
+        return
 
     # Export data
     exporter = get_exporter(outfile)
@@ -129,6 +156,23 @@ def main():
     file_type.add_argument('--html', help='save results in an .html file.',
                            action='store_true')
 
+    # Add pruning optional argument
+    solver.add_argument('--prune', help=prune_help, action='store_true')
+
+    # Add provability check optional argument
+    solver.add_argument('--check', help=check_help, action='store_true')
+
+    # Add per-run rule optional argument
+    solver.add_argument('--rule', help=solve_rule_help, action='append', default=[],
+                        nargs=3, metavar=('SIDE', 'CONNECTIVE', 'VALUE'))
+
+    # Add selection strategy optional argument
+    solver.add_argument('--strategy', help=strategy_help, default='leftmost',
+                        choices=SELECTION_STRATEGIES)
+
+    # Add compression optional argument
+    solver.add_argument('--compress', help=compress_help, action='store_true')
+
     # Add solver main arguments.
     solver.add_argument('infile', help='file to be imported')
     solver.add_argument('outfile', default=None,
@@ -155,8 +199,18 @@ def main():
             elif args.html:
                 filetype = '.html'
 
+            # Apply any rules or strategy given for this run only
+            rules = None
+            if args.rule or args.strategy != 'leftmost' or args.compress:
+                rules = RuleTable.from_settings(strategy=args.strategy, compress=args.compress)
+                for side, connective, value in args.rule:
+                    rule_args = argparse.Namespace(side=side, connective=connective, value=value)
+                    connective, side, value = normalize_rule_args(rule_args)
+                    rules = rules.override(side, connective, value)
+
             # Run solver
-            solve(args.infile, args.outfile, filetype)
+            solve(args.infile, args.outfile, filetype, prune=args.prune,
+                  check=args.check, rules=rules)
 
         case 'set':
             # Set rules in config.json 
@@ -0,0 +1,384 @@
+"""
+Module containing the PropositionArena class.
+
+An arena is a compact store for large numbers of propositions. Rather
+than keeping one Python object per subproposition, it keeps one row per
+distinct subproposition in a handful of arrays:
+
+- 'codes': which class the proposition is (see CLASSES).
+- 'left': the id of the first subproposition or, for atoms, the index
+of the atom's string in .symbols.
+- 'right': the id of the second subproposition of a binary proposition,
+the index of a quantifier's variable in .symbols, or -1.
+- 'complexities': the proposition's complexity.
+- 'name_sets' and 'variable_sets': the index of the proposition's names
+in .names_table, and of its unbound variables in .variables_table.
+
+Propositions are identified by their row (an int), and structurally
+equal propositions share one row, so comparing two ids is comparing the
+propositions they stand for.
+>>> import convert
+>>> arena = PropositionArena()
+>>> p = arena.add(convert.string_to_proposition('P<alice> & ~ Q'))
+>>> p == arena.add(convert.string_to_proposition('(P<alice> & ~ Q)'))
+True
+
+Ids can be turned back into propositions with .to_proposition(), or
+wrapped in a PropositionHandle, which offers the read-only side of the
+Proposition interface (.content, .symb, .complexity, .names,
+.instantiate(), etc.) without creating any propositions.
+>>> handle = arena.handle(p)
+>>> handle.complexity, handle.symb, str(handle)
+(2, '&', '(P<alice> & ~ Q)')
+
+The names and unbound variables of each row are worked out once, when
+it is added, so asking a handle for them costs no more than asking a
+proposition. Each distinct set of them is stored once, in .names_table
+or .variables_table, and rows refer to it by index, so that the many
+rows with no names or variables take no more room than their index.
+
+Rows are found by their code, left and right through a hash table of
+row ids kept in an array, so that looking up a row does not take an
+object per row either.
+
+Arenas pickle as their arrays and symbols, which makes them much
+cheaper to send between processes than the equivalent propositions.
+"""
+
+__all__ = ['PropositionArena', 'PropositionHandle']
+
+from array import array
+from typing import Self
+
+from proposition import Proposition, Atom, Negation, Conjunction, \
+    Disjunction, Conditional, Quantifier, Universal, Existential, NO_NAMES
+
+# Classes in the order of their codes in PropositionArena.codes.
+CLASSES: tuple[type[Proposition], ...] = (
+    Atom, Negation, Conjunction, Disjunction, Conditional, Universal, Existential
+)
+
+CODES: dict[type[Proposition], int] = {cls: code for code, cls in enumerate(CLASSES)}
+
+ATOM = CODES[Atom]
+
+# Marks an empty slot in PropositionArena's hash table of rows.
+EMPTY = -1
+
+
+class PropositionArena:
+    """
+    Column-wise store of propositions, addressed by integer ids.
+    """
+    def __init__(self) -> None:
+        self.codes = array('b')
+        self.left = array('i')
+        self.right = array('i')
+        self.complexities = array('i')
+        self.name_sets = array('i')
+        self.variable_sets = array('i')
+        self.symbols: list[str] = []
+        self.names_table: list[frozenset[str]] = [NO_NAMES]
+        self.variables_table: list[tuple[str, ...]] = [()]
+        self._symbol_ids: dict[str, int] = {}
+        self._names_ids: dict[frozenset[str], int] = {NO_NAMES: 0}
+        self._variables_ids: dict[tuple[str, ...], int] = {(): 0}
+        self._slots = array('i', [EMPTY]) * 8
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getstate__(self) -> dict:
+        # The lookup tables are rebuilt from the columns on load.
+        return {
+            'codes': self.codes,
+            'left': self.left,
+            'right': self.right,
+            'complexities': self.complexities,
+            'name_sets': self.name_sets,
+            'variable_sets': self.variable_sets,
+            'symbols': self.symbols,
+            'names_table': self.names_table,
+            'variables_table': self.variables_table
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._names_ids = {names: i for i, names in enumerate(self.names_table)}
+        self._variables_ids = {
+            variables: i for i, variables in enumerate(self.variables_table)
+        }
+        self._resize()
+
+    def add(self, prop: Proposition) -> int:
+        """Store prop and its subpropositions, and return prop's id."""
+        cls = prop.__class__
+        if cls is Atom:
+            return self._row(ATOM, self._symbol(prop.prop), -1, 0)
+        if isinstance(prop, Quantifier):
+            left = self.add(prop.prop)
+            right = self._symbol(prop.variable)
+        else:
+            children = [self.add(p) for p in prop.content]
+            left = children[0]
+            right = children[1] if len(children) == 2 else -1
+        return self._row(CODES[cls], left, right, prop.complexity)
+
+    def handle(self, prop_id: int) -> 'PropositionHandle':
+        """Return a handle on the proposition with id prop_id."""
+        return PropositionHandle(self, prop_id)
+
+    def to_proposition(self, prop_id: int) -> Proposition:
+        """Return the proposition with id prop_id."""
+        cls = CLASSES[self.codes[prop_id]]
+        left, right = self.left[prop_id], self.right[prop_id]
+        if cls is Atom:
+            return cls(self.symbols[left])
+        if issubclass(cls, Quantifier):
+            return cls(self.symbols[right], self.to_proposition(left))
+        if right == -1:
+            return cls(self.to_proposition(left))
+        return cls(self.to_proposition(left), self.to_proposition(right))
+
+    def names(self, prop_id: int) -> frozenset[str]:
+        """Return the names in the proposition with id prop_id."""
+        return self.names_table[self.name_sets[prop_id]]
+
+    def unbound_variables(self, prop_id: int) -> tuple[str, ...]:
+        """
+        Return the unbound variables in the proposition with id prop_id.
+        """
+        return self.variables_table[self.variable_sets[prop_id]]
+
+    def instantiate(self, prop_id: int, variable: str, name: str) -> int:
+        """
+        Return the id of the proposition with id prop_id instantiated
+        as by Proposition.instantiate.
+        """
+        code, left, right = self._unpack(prop_id)
+        if issubclass(CLASSES[code], Quantifier) and self.symbols[right] == variable:
+            return self.substitute(left, variable, name)
+        return self.substitute(prop_id, variable, name)
+
+    def substitute(self, prop_id: int, variable: str, name: str) -> int:
+        """
+        Return the id of the proposition with id prop_id with its free
+        instances of variable replaced with name.
+        """
+        code, left, right = self._unpack(prop_id)
+        cls = CLASSES[code]
+        if cls is Atom:
+            atom = Atom(self.symbols[left])
+            new_atom = atom.substitute(variable, name)
+            if new_atom is atom:
+                return prop_id
+            return self._row(ATOM, self._symbol(new_atom.prop), -1, 0)
+        if issubclass(cls, Quantifier):
+            if self.symbols[right] == variable:
+                return prop_id
+            new_left, new_right = self.substitute(left, variable, name), right
+        else:
+            new_left = self.substitute(left, variable, name)
+            new_right = right if right == -1 else self.substitute(right, variable, name)
+        if (new_left, new_right) == (left, right):
+            return prop_id
+        return self._row(code, new_left, new_right, self.complexities[prop_id])
+
+    def _unpack(self, prop_id: int) -> tuple[int, int, int]:
+        return self.codes[prop_id], self.left[prop_id], self.right[prop_id]
+
+    def _children(self, prop_id: int) -> tuple[int, ...]:
+        return self._row_children(*self._unpack(prop_id))
+
+    @staticmethod
+    def _row_children(code: int, left: int, right: int) -> tuple[int, ...]:
+        if code == ATOM:
+            return ()
+        if right == -1 or issubclass(CLASSES[code], Quantifier):
+            return left,
+        return left, right
+
+    def _add_metadata(self, code: int, left: int, right: int) -> None:
+        # Record the names and unbound variables of a new row, whose
+        # subpropositions' rows already have theirs. Rows whose
+        # subpropositions add nothing to each other's reuse their index.
+        if code == ATOM:
+            atom = Atom(self.symbols[left])
+            self.name_sets.append(self._names_id(atom.names))
+            self.variable_sets.append(self._variables_id(atom.unbound_variables))
+            return
+        children = self._row_children(code, left, right)
+        name_sets = {self.name_sets[i] for i in children}
+        if len(name_sets) == 1:
+            names_id, = name_sets
+        else:
+            names_id = self._names_id(frozenset().union(
+                *(self.names_table[i] for i in name_sets)
+            ))
+        self.name_sets.append(names_id)
+
+        variable_sets = {self.variable_sets[i] for i in children}
+        if len(variable_sets) == 1:
+            variables_id, = variable_sets
+            variables = self.variables_table[variables_id]
+        else:
+            variables = set().union(*(self.variables_table[i] for i in variable_sets))
+            variables = tuple(sorted(variables))
+            variables_id = None
+        if issubclass(CLASSES[code], Quantifier) and self.symbols[right] in variables:
+            variables = tuple(v for v in variables if v != self.symbols[right])
+            variables_id = None
+        if variables_id is None:
+            variables_id = self._variables_id(variables)
+        self.variable_sets.append(variables_id)
+
+    def _names_id(self, names: frozenset[str]) -> int:
+        try:
+            return self._names_ids[names]
+        except KeyError:
+            self.names_table.append(names)
+            self._names_ids[names] = len(self.names_table) - 1
+            return len(self.names_table) - 1
+
+    def _variables_id(self, variables: tuple[str, ...]) -> int:
+        try:
+            return self._variables_ids[variables]
+        except KeyError:
+            self.variables_table.append(variables)
+            self._variables_ids[variables] = len(self.variables_table) - 1
+            return len(self.variables_table) - 1
+
+    def _symbol(self, string: str) -> int:
+        try:
+            return self._symbol_ids[string]
+        except KeyError:
+            self.symbols.append(string)
+            self._symbol_ids[string] = len(self.symbols) - 1
+            return len(self.symbols) - 1
+
+    def _row(self, code: int, left: int, right: int, complexity: int) -> int:
+        slot = self._slot(code, left, right)
+        if (row := self._slots[slot]) != EMPTY:
+            return row
+        self.codes.append(code)
+        self.left.append(left)
+        self.right.append(right)
+        self.complexities.append(complexity)
+        self._add_metadata(code, left, right)
+        row = len(self.codes) - 1
+        self._slots[slot] = row
+        if 2 * len(self.codes) > len(self._slots):
+            self._resize()
+        return row
+
+    def _slot(self, code: int, left: int, right: int) -> int:
+        # Return the slot of the hash table holding the row with this
+        # code, left and right, or the empty slot where it would go.
+        mask = len(self._slots) - 1
+        slot = hash((code, left, right)) & mask
+        while (row := self._slots[slot]) != EMPTY:
+            if self.codes[row] == code and self.left[row] == left \
+                    and self.right[row] == right:
+                return slot
+            slot = (slot + 1) & mask
+        return slot
+
+    def _resize(self) -> None:
+        # Rebuild the hash table with room for at least twice as many
+        # slots as rows (and a power of two of them).
+        size = 8
+        while size < 4 * len(self.codes):
+            size *= 2
+        self._slots = array('i', [EMPTY]) * size
+        for row in range(len(self.codes)):
+            self._slots[self._slot(*self._unpack(row))] = row
+
+
+class PropositionHandle:
+    """
+    Lightweight stand-in for a proposition stored in a PropositionArena.
+    """
+    __slots__ = 'arena', 'id'
+
+    def __init__(self, arena: PropositionArena, prop_id: int) -> None:
+        self.arena = arena
+        self.id = prop_id
+
+    def __repr__(self) -> str:
+        return f'PropositionHandle({self.id})'
+
+    def __str__(self) -> str:
+        return str(self.to_proposition())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PropositionHandle):
+            return False
+        return self.arena is other.arena and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.id))
+
+    def __getitem__(self, index: int) -> str | Self:
+        return self.content[index]
+
+    @property
+    def cls(self) -> type[Proposition]:
+        """Return the class of the proposition this handle stands for."""
+        return CLASSES[self.arena.codes[self.id]]
+
+    @property
+    def arity(self) -> int:
+        return self.cls.arity
+
+    @property
+    def symb(self) -> str:
+        return self.cls.symb
+
+    @property
+    def word(self) -> str:
+        return self.cls.word
+
+    @property
+    def variable(self) -> str:
+        """Return the bound variable of a quantifier, or ''."""
+        if issubclass(self.cls, Quantifier):
+            return self.arena.symbols[self.arena.right[self.id]]
+        return ''
+
+    @property
+    def content(self) -> tuple[str] | tuple[Self, ...]:
+        """
+        Return a handle on each subproposition, or the atom's string.
+        """
+        if self.cls is Atom:
+            return self.arena.symbols[self.arena.left[self.id]],
+        return tuple(
+            PropositionHandle(self.arena, i) for i in self.arena._children(self.id)
+        )
+
+    @property
+    def complexity(self) -> int:
+        return self.arena.complexities[self.id]
+
+    @property
+    def names(self) -> frozenset[str]:
+        return self.arena.names(self.id)
+
+    @property
+    def unbound_variables(self) -> tuple[str, ...]:
+        return self.arena.unbound_variables(self.id)
+
+    @property
+    def long_string(self) -> str:
+        return self.to_proposition().long_string
+
+    def instantiate(self, variable: str, name: str) -> Self:
+        """Return a handle on this proposition instantiated with name."""
+        return PropositionHandle(
+            self.arena, self.arena.instantiate(self.id, variable, name)
+        )
+
+    def to_proposition(self) -> Proposition:
+        """Return the proposition this handle stands for."""
+        return self.arena.to_proposition(self.id)
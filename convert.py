@@ -3,16 +3,24 @@ Package for converting objects of one type to another.
 """
 
 __all__ = [
-    'dict_to_tree', 'sequent_to_tree', 'string_to_proposition',
-    'string_to_sequent', 'string_to_tree', 'tree_to_dict'
+    'dict_to_tree', 'iter_sequent_lines', 'iter_sequents', 'names_in_lines',
+    'sequent_to_tree',
+    'string_to_proposition', 'string_to_sequent', 'string_to_tree',
+    'tree_to_dict'
 ]
 
-from typing import Protocol, Type
+import re
 
+from collections import OrderedDict
+from typing import Generator, Hashable, Iterable, Protocol, Type
 
-from proposition import Atom, Negation, Universal, Existential, Conjunction, Disjunction, Conditional, Proposition
+
+import proposition
+from proposition import Atom, Negation, Universal, Existential, Conjunction, \
+    Disjunction, Conditional, Proposition, make
 from sequent import Sequent
-from tree import Tree
+from rules import RuleTable
+from tree import Tree, TreeMemo
 
 
 NEST_MAP = {
@@ -21,6 +29,82 @@ NEST_MAP = {
 }
 
 
+# How many results each parse cache holds before evicting the oldest.
+PARSE_CACHE_SIZE = 2 ** 16
+
+
+class ParseCache:
+    """
+    Bounded least-recently-used cache of parse results, which counts
+    its hits and misses.
+    """
+    def __init__(self, maxsize: int = PARSE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.data: OrderedDict[Hashable, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, key: Hashable) -> object | None:
+        """Return the result cached under key, or None."""
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Cache value under key, evicting the least recently used."""
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Empty the cache and reset its counters."""
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+proposition_cache = ParseCache()
+sequent_cache = ParseCache()
+
+# The intern table in use when the caches were last filled (see
+# proposition.start_interning). The caches are emptied when it changes,
+# so that they never hand out propositions from another table.
+cached_intern_table: proposition.InternTable | None = None
+
+
+def check_intern_table() -> None:
+    """Empty the parse caches if interning has changed since they were filled."""
+    global cached_intern_table
+    if proposition.intern_table is not cached_intern_table:
+        proposition_cache.clear()
+        sequent_cache.clear()
+        cached_intern_table = proposition.intern_table
+
+
+# Connective words and symbols, by the proposition they form.
+NEGATIONS = {'~', 'not'}
+
+BINARIES = {
+    '&': Conjunction, 'and': Conjunction,
+    'v': Disjunction, 'or': Disjunction,
+    '->': Conditional, 'implies': Conditional
+}
+
+QUANTIFIERS = {
+    '∀': Universal, 'forall': Universal,
+    '∃': Existential, 'exists': Existential
+}
+
+
 def string_to_proposition(string) -> Proposition:
     """
     Convert input string into proposition of the appropriate type.
@@ -28,24 +112,59 @@ def string_to_proposition(string) -> Proposition:
     ->, ~) or the associated word ('and', 'or', 'implies', 'not'). 
     Empty strings raise a value error. If a connective word or symbol
     cannot be matched, an atom with the full string is returned.
+
+    Well-formed strings are read in a single pass by PropositionParser.
+    The only strings it does not accept are those with parentheses
+    inside an atom (e.g. 'P(a)') or unbalanced ones, and those with a
+    connective missing a side, which it has no grammar for. Those are
+    split at their main connective by split_string_to_proposition, and
+    each side is passed back here, so only the malformed parts of a
+    string are ever split rather than parsed.
+
+    Results are kept in proposition_cache under the string's tokens
+    without any outer parentheses, so that repeated strings are only
+    parsed once and give back the same (immutable) proposition, whatever
+    their spacing or outer parentheses. Parts of strings are not cached:
+    keying each of them on its tokens would make parsing quadratic in
+    the depth of nesting. The cache is emptied whenever interning is
+    switched on or off, or to another table.
+    """
+    try:
+        parser = PropositionParser(string)
+    except NotWellFormed:
+        parser, key = None, string
+    else:
+        key = parser.key(0, len(parser.tokens))
+    if (prop := proposition_cache.get(key)) is not None:
+        return prop
+    try:
+        if parser is None:
+            raise NotWellFormed(f'Cannot tokenize {string!r}.')
+        prop = parser.parse()
+    except NotWellFormed:
+        prop = split_string_to_proposition(string)
+    proposition_cache.put(key, prop)
+    return prop
+
+
+def split_string_to_proposition(string) -> Proposition:
+    """
+    Convert input string into a proposition by splitting it at its
+    main connective and converting each side with
+    string_to_proposition. This is the fallback for strings which
+    PropositionParser does not accept (see string_to_proposition).
     """
     string = deparenthesize(string)
     split_string: list[str] = find_connective(string)
 
     fac: Type[PropositionFactory]
     match split_string:
-        case [_, '&' | 'and', _]:
-            fac = ConjunctionFactory
-        case [_, '->' | 'implies', _]:
-            fac = ConditionalFactory
-        case [_, 'v' | 'or', _]:
-            fac = DisjunctionFactory
-        case ['~' | 'not', _]:
+        case [_, connective, _] if connective in BINARIES:
+            fac = FACTORIES[BINARIES[connective]]
+        case [connective, _] if connective in NEGATIONS:
             fac = NegationFactory
-        case ['∀' | 'forall', _, _]:
-            fac = UniversalFactory
-        case ['∃' | 'exists', _, _]:
-            fac = ExistentialFactory
+        case [quantifier, _, _] if quantifier in QUANTIFIERS:
+            fac = FACTORIES[QUANTIFIERS[quantifier]]
         case '':
             raise ValueError('Cannot convert empty string to proposition.')
         case _:
@@ -53,15 +172,22 @@ def string_to_proposition(string) -> Proposition:
     return fac().get_prop(*split_string)
 
 
-def sequent_to_tree(sequent: Sequent, names: set = None, grow: bool = True) -> Tree:
+def sequent_to_tree(sequent: Sequent, names: set = None, grow: bool = True,
+                    prune: bool = False, memo: TreeMemo = None,
+                    rule_table: RuleTable = None) -> Tree:
     """
-    Return a solved tree whose root is the input sequent. 
+    Return a solved tree whose root is the input sequent. If a memo is
+    given, the tree (and its parents) may be shared with other trees
+    and is grown with the memo's rule table rather than rule_table.
     """
     if names is None:
         names = set()
-    tree = Tree(root=sequent, names=names)
+    if memo is None:
+        tree = Tree(root=sequent, names=names, prune=prune, rule_table=rule_table)
+    else:
+        tree = memo.tree(sequent, names=names, prune=prune)
     if grow:
-        tree.grow()
+        tree.grow_all()
     return tree
 
 
@@ -121,28 +247,103 @@ def string_to_sequent(string: str) -> Sequent:
     )
     """
     # First we split into antecedent and consequent as whole strings
+    if (semicolons := string.count(';')) != 1:
+        raise ValueError(
+            f'Sequents need exactly one semicolon, not {semicolons}: {string!r}'
+        )
     ant_string, con_string = string.split(';')
     
     # For each side, we split it by comma, and remove whitespace from
-    # the extremities. If there's nothing but whitespace, then that 
-    # was empty. Otherwise, we turn each string into the proposition
-    # it represents
+    # the extremities. 
     ant_list: list[str] = [s.strip(' ') for s in ant_string.split(',')]
+    con_list: list[str] = [s.strip(' ') for s in con_string.split(',')]
+
+    # Sequents differing only in spacing around commas and the
+    # semicolon share a cache entry.
+    key = tuple(ant_list), tuple(con_list)
+    check_intern_table()
+    if (sequent := sequent_cache.get(key)) is not None:
+        return sequent
+
+    # If there's nothing but whitespace, then that was empty. 
+    # Otherwise, we turn each string into the proposition it represents
     if ant_list == ['']:  
         antecedents = ()
     else:
         antecedents = tuple(map(string_to_proposition, ant_list))
 
-    con_list: list[str] = [s.strip(' ') for s in con_string.split(',')]
     if con_list == ['']:
         consequents = ()
     else:
         consequents = tuple(map(string_to_proposition, con_list))
 
-    return Sequent(
+    sequent = Sequent(
         antecedents,
         consequents
     )
+    sequent_cache.put(key, sequent)
+    return sequent
+
+
+def iter_sequent_lines(lines: Iterable[str]
+                       ) -> Generator[tuple[int, str], None, None]:
+    """
+    Lazily yield the line number (counting from 1) and stripped contents
+    of each of lines that isn't blank or a comment (starting with '#').
+    >>> list(iter_sequent_lines(['A; B', '', '# comment', ' C; D ']))
+    [(1, 'A; B'), (4, 'C; D')]
+    """
+    for line_number, line in enumerate(lines, start=1):
+        string = line.strip()
+        if string and not string.startswith('#'):
+            yield line_number, string
+
+
+# The objects of each atom in a string.
+objects_in_string_re = re.compile(r'<([^<>]*)>')
+
+
+def names_in_lines(lines: Iterable[str]) -> set[str]:
+    """
+    Return the names in the sequents on lines, without parsing them.
+    Lines are split into propositions as string_to_sequent splits them,
+    and names are the objects longer than one character, as for Atom.
+    >>> sorted(names_in_lines(['P<amy>; Q', 'forallx R<x>, S<bob>;']))
+    ['amy', 'bob']
+    """
+    names = set()
+    for _, line in iter_sequent_lines(lines):
+        for string in re.split('[;,]', line):
+            for objects in objects_in_string_re.findall(string):
+                names.update(o for o in objects.split(', ') if len(o) > 1)
+    return names
+
+
+def iter_sequents(lines: Iterable[str],
+                  errors: list[tuple[int, str]] = None
+                  ) -> Generator[Sequent, None, None]:
+    """
+    Lazily yield the sequent on each of lines, skipping blank lines and
+    comments (lines starting with '#').
+
+    Lines that cannot be converted raise a ValueError giving their line
+    number, unless an errors list is passed in, in which case a
+    (line number, message) pair is appended to it and the line skipped.
+    >>> errors = []
+    >>> list(iter_sequents(['A; B', '# comment', 'A, B'], errors))
+    [Sequent((Atom('A'),), (Atom('B'),))]
+    >>> errors
+    [(3, "Sequents need exactly one semicolon, not 0: 'A, B'")]
+    """
+    for line_number, string in iter_sequent_lines(lines):
+        try:
+            sequent = string_to_sequent(string)
+        except ValueError as error:
+            if errors is None:
+                raise ValueError(f'Line {line_number}: {error}') from error
+            errors.append((line_number, str(error)))
+            continue
+        yield sequent
 
 
 class PropositionFactory(Protocol):
@@ -157,7 +358,7 @@ class AtomFactory:
 
     def get_prop(self, content) -> Atom:
         """Return an Atom instance."""
-        return Atom(content)
+        return make(Atom, content)
 
 
 class NegationFactory:
@@ -165,21 +366,21 @@ class NegationFactory:
 
     def get_prop(self, _, prop) -> Negation:
         """Return a Negation instance."""
-        return Negation(string_to_proposition(prop))
+        return make(Negation, string_to_proposition(prop))
 
 
 class UniversalFactory:
     """Factory for Universals."""
 
     def get_prop(self, _, var, prop) -> Universal:
-        return Universal(var, string_to_proposition(prop))
+        return make(Universal, var, string_to_proposition(prop))
 
 
 class ExistentialFactory:
     """Factory for Existentials."""
 
     def get_prop(self, _, var, prop) -> Existential:
-        return Existential(var, string_to_proposition(prop))
+        return make(Existential, var, string_to_proposition(prop))
 
 
 class ConjunctionFactory:
@@ -187,7 +388,8 @@ class ConjunctionFactory:
 
     def get_prop(self, left, _, right) -> Conjunction:
         """Return a Conjunction instance."""
-        return Conjunction(
+        return make(
+            Conjunction,
             string_to_proposition(left),
             string_to_proposition(right)
         )
@@ -198,7 +400,8 @@ class DisjunctionFactory:
 
     def get_prop(self, left, _, right) -> Disjunction:
         """Return a Disjunction instance."""
-        return Disjunction(
+        return make(
+            Disjunction,
             string_to_proposition(left),
             string_to_proposition(right)
         )
@@ -209,17 +412,185 @@ class ConditionalFactory:
 
     def get_prop(self, ant, _, con) -> Conditional:
         """Return a Conditional instance."""
-        return Conditional(
+        return make(
+            Conditional,
             string_to_proposition(ant),
             string_to_proposition(con)
         )
 
 
+FACTORIES: dict[type[Proposition], Type[PropositionFactory]] = {
+    Conjunction: ConjunctionFactory,
+    Disjunction: DisjunctionFactory,
+    Conditional: ConditionalFactory,
+    Universal: UniversalFactory,
+    Existential: ExistentialFactory
+}
+
+
+class NotWellFormed(ValueError):
+    """Raised by PropositionParser for strings it cannot parse."""
+
+
+def tokenize(string: str) -> list[tuple[str, str]]:
+    """
+    Return string as a list of (kind, text) tokens, where kind is one of
+    '(', ')', 'not', 'binary', 'quantifier', or 'word'.
+
+    Like find_connective, this splits the string on single spaces, so
+    connectives must be whole words. Parentheses are only split off the
+    start and end of words; words with parentheses anywhere else raise
+    NotWellFormed.
+
+    >>> tokenize('~ (A v B<c, d>)')
+    [('not', '~'), ('(', '('), ('word', 'A'), ('binary', 'v'), \
+('word', 'B<c,'), ('word', 'd>'), (')', ')')]
+    """
+    tokens = []
+    for word in string.split(' '):
+        core = word.lstrip('(')
+        tokens.extend([('(', '(')] * (len(word) - len(core)))
+
+        closing = len(core)
+        core = core.rstrip(')')
+        closing -= len(core)
+        if '(' in core or ')' in core:
+            raise NotWellFormed(f'Unexpected parenthesis in {word!r}.')
+
+        if core in NEGATIONS:
+            tokens.append(('not', core))
+        elif core in BINARIES:
+            tokens.append(('binary', core))
+        elif core[:-1] in QUANTIFIERS:
+            tokens.append(('quantifier', core))
+        else:
+            tokens.append(('word', core))
+        tokens.extend([(')', ')')] * closing)
+    return tokens
+
+
+class PropositionParser:
+    """
+    Single-pass parser from strings to propositions.
+
+    Negations and quantifiers scope over the rest of the (sub)string
+    they begin, and binary connectives have equal precedence and group
+    to the right, which is how find_connective splits strings:
+    >>> PropositionParser('~ A & B v C').parse()
+    Negation(Conjunction(Atom('A'), Disjunction(Atom('B'), Atom('C'))))
+
+    Runs of words between connectives make up atoms, and non-connective
+    words are kept as they are, spaces included, in the atom.
+    """
+    def __init__(self, string: str) -> None:
+        check_intern_table()
+        self.tokens = tokenize(string)
+        self.position = 0
+        # The position of the closing parenthesis matching each opening
+        # one (unmatched ones are left out).
+        self.matches: dict[int, int] = {}
+        opened = []
+        for position, (kind, _) in enumerate(self.tokens):
+            if kind == '(':
+                opened.append(position)
+            elif kind == ')' and opened:
+                self.matches[opened.pop()] = position
+
+    def key(self, start: int, end: int) -> tuple[str, ...]:
+        """
+        Return the cache key for the tokens from start up to end: their
+        text, without any parentheses enclosing all of them.
+        """
+        while end - start > 2 and self.matches.get(start) == end - 1:
+            start += 1
+            end -= 1
+        return tuple(text for _, text in self.tokens[start:end])
+
+    def parse(self) -> Proposition:
+        """
+        Return the proposition the whole string represents. Raise
+        NotWellFormed if it does not represent one.
+        """
+        prop = self.expression()
+        if self.position != len(self.tokens):
+            raise NotWellFormed(f'Unexpected {self.tokens[self.position][1]!r}.')
+        return prop
+
+    def expression(self) -> Proposition:
+        """
+        Parse the tokens up to the end of the current parenthesis (or
+        string) as one proposition.
+        """
+        # Each operand, with the negations and quantifiers in front of it
+        # and the binary connective behind it (if any).
+        segments: list[tuple[list[tuple[str, str]], Proposition, str]] = []
+        while True:
+            prefixes = self.prefixes()
+            operand = self.operand()
+            kind, text = self.peek()
+            if kind != 'binary':
+                segments.append((prefixes, operand, ''))
+                break
+            self.position += 1
+            segments.append((prefixes, operand, text))
+
+        # Fold from the right, so that each connective and prefix takes
+        # everything after it as its right-hand side.
+        prop = None
+        for prefixes, operand, connective in reversed(segments):
+            if connective:
+                prop = make(BINARIES[connective], operand, prop)
+            else:
+                prop = operand
+            for kind, text in reversed(prefixes):
+                if kind == 'not':
+                    prop = make(Negation, prop)
+                else:
+                    prop = make(QUANTIFIERS[text[:-1]], text[-1], prop)
+        return prop
+
+    def prefixes(self) -> list[tuple[str, str]]:
+        """Consume and return the negations and quantifiers ahead."""
+        start = self.position
+        while self.peek()[0] in ('not', 'quantifier'):
+            self.position += 1
+        return self.tokens[start:self.position]
+
+    def operand(self) -> Proposition:
+        """Parse a parenthesized proposition or an atom."""
+        kind, _ = self.peek()
+        if kind == '(':
+            end = self.matches.get(self.position)
+            self.position += 1
+            prop = self.expression()
+            if end is None or self.position != end:
+                raise NotWellFormed('Unclosed parenthesis.')
+            self.position += 1
+            return prop
+
+        words = []
+        while kind not in ('binary', '(', ')', ''):
+            words.append(self.tokens[self.position][1])
+            self.position += 1
+            kind, _ = self.peek()
+        if kind == '(' or not words:
+            raise NotWellFormed('Expected a proposition.')
+        return make(Atom, ' '.join(words))
+
+    def peek(self) -> tuple[str, str]:
+        """Return the next token, or ('', '') at the end."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return '', ''
+
+
 def find_connective(string: str) -> list[str]:
     """
     Return a list of strings separating the main connective from
     surrounding propositional material. Deparenthesizes sub-
-    propositions.
+    propositions. Connectives are those in NEGATIONS, BINARIES and
+    QUANTIFIERS, as for PropositionParser; this is only used to split
+    strings it does not accept (see string_to_proposition).
 
     >>> find_connective('A & B')
     ['A', '&', 'B']
@@ -235,21 +606,16 @@ def find_connective(string: str) -> list[str]:
     if not string:
         return ['']
 
-    # connective keywords
-    negations = {'~', 'not'}
-    binaries = {'&', 'v', 'and', 'or', '->', 'implies'}
-    quantifiers = {'∃', '∀', 'exists', 'forall'}
-
     word_list = string.split(' ')
 
     # Check for negation as main connective.
-    if (connective := word_list[0]) in negations:
+    if (connective := word_list[0]) in NEGATIONS:
         negatum = ' '.join(word_list[1:])
         return [connective, deparenthesize(negatum)]
 
     # Check for quantifiers as main connective.
     # The first slice into word_list finds a word, the second, a letter
-    if (connective := word_list[0][:-1]) in quantifiers:
+    if (connective := word_list[0][:-1]) in QUANTIFIERS:
         variable = word_list[0][-1]
         prop = ' '.join(word_list[1:])
         return [connective, variable, deparenthesize(prop)]
@@ -264,7 +630,7 @@ def find_connective(string: str) -> list[str]:
             # No change for other characters.
             nestedness += NEST_MAP[char] if char in NEST_MAP else 0
 
-        if (connective := word) in binaries and nestedness == 0:
+        if (connective := word) in BINARIES and nestedness == 0:
             left = deparenthesize(' '.join(word_list[:i]))
             right = deparenthesize(' '.join(word_list[i + 1:]))
             return [left, connective, right]
@@ -18,6 +18,9 @@ from typing import Protocol
 from convert import tree_to_dict
 from HTML.document import Builder
 
+# Greatest number of splits of each tree that HTMLExporter typesets.
+SPLIT_LIMIT = 64
+
 
 class Exporter(Protocol):
     """Protocol for exporters."""
@@ -73,8 +76,12 @@ class HTMLExporter:
     Class for exporting data to an .html file for viewing.
     The plan is to eventually be able to typeset trees as an html
     file that can be opened in any web browser.
+
+    Only the first split_limit splits of each tree are typeset, since
+    bushy trees can have more than any page could hold. Rules applied
+    in one step (see tree.Tree.steps) are typeset one at a time.
     """
-    def __init__(self, file) -> None:
+    def __init__(self, file, split_limit: int = SPLIT_LIMIT) -> None:
         path = Path(file)
         if not (parent := path.parent).exists():
             os.makedirs(parent)
@@ -84,10 +91,14 @@ class HTMLExporter:
             if not path.exists():
                 os.makedirs(path)
             self.file = path / 'results.json'
+        self.split_limit = split_limit
 
     def export(self, data) -> None:
         forest = data['forest']
-        trees = [subtree for tree in forest for subtree in tree.split]
+        trees = [
+            subtree.expand() for tree in forest
+            for subtree in tree.iter_splits(limit=self.split_limit)
+        ]
         builder = Builder()
         builder.build(trees)
         builder.save(self.file)
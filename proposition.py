@@ -16,16 +16,16 @@ empty string ('').)
 - 'word': the string which corresponds to self.symb in natural language.
 
 - 'complexity': a measure of how deeply nested the most-nested
-subproposition is. This is measured recursively for each proposition and
-subproposition, with Atoms having complexity 0.
+subproposition is. This is measured for each proposition from its
+subpropositions when it is created, with Atoms having complexity 0.
 
 - Binary propositions have a 'left' and 'right' property, corresponding
 to the subproposition on that side of their main connective. Negations
 meanwhile have the 'negatum' property and Atoms, 'prop'. These can be
 accessed class-agnostically by accessing the object's .content property.
 
-- names: a tuple of strings containing each name in the proposition and
-subpropositions. Names are always two or more lowercase letters.
+- names: a frozenset of strings containing each name in the proposition
+and subpropositions. Names are always two or more lowercase letters.
 
 - unbound_variables: a tuple of strings containing each unbound variable
 in the proposition. Unbound variables are single lowercase letters not
@@ -36,6 +36,11 @@ replaced with a name. If the proposition is a quantifier and the
 variable, is the variable it binds, instead return the subproposition
 (i.e. remove the quantifier).
 
+- substitute: like instantiate, but only replaces free instances of the
+variable, so quantifiers binding it are left as they are. Subpropositions
+in which the variable is not free are reused rather than rebuilt, so the
+result shares them with the original.
+
 Notably, Atoms have strings as their propositional content, while all
 other propositions have Propositions (atoms or otherwise) as their
 content.
@@ -43,19 +48,35 @@ content.
 Note that for most uses, you should prefer creating the classes in this
 module by using the functions in the convert module (e.g.,
 string_to_proposition) over creating these classes directly.
+
+Propositions can optionally be interned, so that structurally equal
+propositions are the same object. Interning is off by default; switch
+it on with start_interning() and off again with stop_interning(). While
+it is on, make(cls, *content) returns the shared instance for that
+class and content (creating it if need be), and both the convert module
+and instantiate() build their propositions through it.
+>>> table = start_interning()
+>>> make(Atom, 'P<x>') is make(Atom, 'P<x>')
+True
+>>> stop_interning()
 """
 
 __all__ = ['Atom', 'Negation', 'Conjunction', 'Conditional', 'Disjunction',
-           'Proposition', 'Quantifier', 'Universal', 'Existential']
+           'Proposition', 'Quantifier', 'Universal', 'Existential',
+           'InternTable', 'make', 'start_interning', 'stop_interning']
 
 import re
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Self
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Self
 
 SIDES: set[str] = {'ant', 'con'}
 
+# Shared by every proposition without names, since each empty frozenset
+# would otherwise be a separate object.
+NO_NAMES: frozenset[str] = frozenset()
+
 # Match anything between angle brackets ('<' and '>')
 objects_re = re.compile(r'<(.*)>')
 
@@ -67,17 +88,42 @@ predicate_re = re.compile(r'(.+)<')
 class Proposition(ABC):
     """
     Base class from which propositions should inherit.
+
+    Complexity, names, unbound variables and the hash are computed once
+    on creation, bottom-up from the (already measured) content, and
+    stored on the instance, so reading them never walks the proposition.
     """
     arity = None  # How many propositions this object contains.
     symb = None  # The logical symbol this object assumes.
     word = None  # The english language word representing self.symb.
 
+    _complexity: int = field(init=False, repr=False, compare=False)
+    _names: frozenset[str] = field(init=False, repr=False, compare=False)
+    _unbound_variables: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         self.validate_content()
+        self._cache_metrics()
+
+    def _cache_metrics(self) -> None:
+        object.__setattr__(self, '_complexity', self._measure_complexity())
+        object.__setattr__(self, '_names', self._collect_names())
+        object.__setattr__(self, '_unbound_variables', self._collect_unbound_variables())
+        object.__setattr__(self, '_hash', hash((self.__class__,) + self.arguments))
 
     def __getitem__(self, index: int) -> str | Self:
         return self.content[index]
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        # Rebuild through make() rather than copying the cached fields:
+        # string hashes differ between interpreters, and an unpickled
+        # proposition should join the receiving process's intern table.
+        return make, (self.__class__,) + self.arguments
+
     @property
     @abstractmethod
     def long_string(self) -> str:
@@ -91,10 +137,15 @@ class Proposition(ABC):
     def content(self) -> tuple:
         """Return this object's propositional content."""
 
+    @property
+    def arguments(self) -> tuple:
+        """Return the arguments this object was created with."""
+        return self.content
+
     @property
     def complexity(self) -> int:
         """Return this object's logical complexity."""
-        return 1 + max(p.complexity for p in self.content)
+        return self._complexity
 
     def validate_content(self) -> None:
         """Raise ValueError if content has incorrect type."""
@@ -105,26 +156,70 @@ class Proposition(ABC):
                 )
 
     @property
-    def names(self) -> set[str]:
-        """Return a tuple of names in self.content."""
-        return {name for prop in self.content for name in prop.names}
+    def names(self) -> frozenset[str]:
+        """Return a set of names in self.content."""
+        return self._names
 
     @property
     def unbound_variables(self) -> tuple[str]:
         """Return a tuple of unbound variables in self.content."""
-        variables = set()
-        for prop in self.content:
-            variables.update(set(prop.unbound_variables))
+        return self._unbound_variables
 
-        return tuple(sorted(variables))  # type: ignore
+    def _measure_complexity(self) -> int:
+        return 1 + max(p.complexity for p in self.content)
+
+    def _collect_names(self) -> frozenset[str]:
+        # Reuse a subproposition's set wherever the others add nothing
+        # to it, so that only propositions joining new names allocate.
+        names = NO_NAMES
+        for prop in self.content:
+            other = prop.names
+            if other <= names:
+                continue
+            names = other if names <= other else names | other
+        return names
+
+    def _collect_unbound_variables(self) -> tuple[str, ...]:
+        variables = ()
+        for prop in self.content:
+            other = prop.unbound_variables
+            if set(other) <= set(variables):
+                continue
+            if set(variables) <= set(other):
+                variables = other
+            else:
+                variables = tuple(sorted(set(variables).union(other)))
+        return variables
 
     def instantiate(self, variable, name) -> Self:
         """
         Return an instance of this class whose instances of variable
         are replaced with name.
         """
-        props = [prop.instantiate(variable, name) for prop in self.content]
-        return self.__class__(*props)  # type: ignore
+        return self.substitute(variable, name)
+
+    def substitute(self, variable, name) -> Self:
+        """
+        Return self with the free instances of variable replaced with
+        name. Subpropositions in which variable is not free (including
+        self) are returned as they are rather than rebuilt.
+        """
+        if variable not in self._unbound_variables:
+            return self
+        props = [prop.substitute(variable, name) for prop in self.content]
+        return make(self.__class__, *props)  # type: ignore
+
+    def substitution(self, variable: str) -> Callable[[str], Self]:
+        """
+        Return a function taking a name to self.substitute(variable,
+        name). Where variable occurs is worked out here, once, so each
+        call only rebuilds the propositions on the way to it.
+        """
+        if variable not in self._unbound_variables:
+            return lambda name: self
+        cls = self.__class__
+        parts = [prop.substitution(variable) for prop in self.content]
+        return lambda name: make(cls, *(part(name) for part in parts))
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -173,12 +268,14 @@ class Quantifier(Proposition):
         return self.prop,
 
     @property
-    def unbound_variables(self) -> tuple[str]:
-        variables = set()
-        for prop in self.content:
-            variables.update(set(prop.unbound_variables))
-        unbound = [v for v in variables if v != self.variable]
-        return tuple(sorted(unbound))
+    def arguments(self) -> tuple[str, Proposition]:
+        return self.variable, self.prop
+
+    def _collect_unbound_variables(self) -> tuple[str, ...]:
+        unbound = self.prop.unbound_variables
+        if self.variable not in unbound:
+            return unbound
+        return tuple(v for v in unbound if v != self.variable)
 
     def instantiate(self, variable: str, name: str) -> Proposition:
         """
@@ -188,12 +285,33 @@ class Quantifier(Proposition):
         """
         if variable == self.variable:
             return self.instantiate_with(name)
-        sub_prop = self.prop.instantiate(variable, name)
-        return self.__class__(self.variable, sub_prop)  # type: ignore
+        return self.substitute(variable, name)
+
+    def substitute(self, variable: str, name: str) -> Proposition:
+        # self.variable is never free in self, so its instances are
+        # left alone here.
+        if variable not in self._unbound_variables:
+            return self
+        sub_prop = self.prop.substitute(variable, name)
+        return make(self.__class__, self.variable, sub_prop)  # type: ignore
+
+    def substitution(self, variable: str) -> Callable[[str], Proposition]:
+        if variable not in self._unbound_variables:
+            return lambda name: self
+        cls, bound = self.__class__, self.variable
+        sub_prop = self.prop.substitution(variable)
+        return lambda name: make(cls, bound, sub_prop(name))
 
     def instantiate_with(self, name: str) -> Self:
         """Return self.prop instantiated with self.variable."""
-        return self.prop.instantiate(self.variable, name)
+        return self.prop.substitute(self.variable, name)
+
+    def instantiate_many(self, names: Iterable[str]) -> tuple[Proposition, ...]:
+        """
+        Return a tuple of self.prop instantiated with each of names, in
+        order. The subproposition is only analysed once for all of them.
+        """
+        return tuple(map(self.prop.substitution(self.variable), names))
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -225,10 +343,24 @@ class Atom(UnaryProposition):
     Proposition class with no logical content.
     """
     prop: str
+    _predicate: str = field(init=False, repr=False, compare=False)
+    _objects: tuple[str, ...] = field(init=False, repr=False, compare=False)
     arity = 1
     symb = ''
     word = ''
 
+    def __post_init__(self) -> None:
+        self.validate_content()
+        # Split 'Pred<a, b>' into 'Pred' and ('a', 'b') once, here.
+        # Atoms without objects are their own predicate.
+        objects = objects_re.search(self.prop)
+        predicate = predicate_re.search(self.prop)
+        objects = tuple(objects.group(1).split(', ')) if objects else ()
+        predicate = predicate.group(1) if predicate else self.prop
+        object.__setattr__(self, '_objects', objects)
+        object.__setattr__(self, '_predicate', predicate)
+        self._cache_metrics()
+
     def __str__(self) -> str:
         return f'{self[0]}'
 
@@ -236,10 +368,6 @@ class Atom(UnaryProposition):
     def long_string(self) -> str:
         return str(self)
 
-    @property
-    def complexity(self) -> int:
-        return 0
-
     def validate_content(self) -> None:
         if not isinstance(self.prop, str):
             raise TypeError(
@@ -247,48 +375,75 @@ class Atom(UnaryProposition):
             )
 
     @property
-    def objects(self) -> list[str]:
+    def objects(self) -> tuple[str, ...]:
         """
         Return the objects (i.e. names and variables) in self.content.
         """
-        result = re.search(objects_re, self.content[0])
-        if result:
-            string = result.group(1)
-            return string.split(', ')
-        return []
+        return self._objects
 
     @property
-    def predicates(self) -> list[str]:
+    def predicate(self) -> str:
         """Return self.content's predicate."""
-        result = re.search(predicate_re, self.content[0])
-        string = result.group(1)
-        return [string]
+        return self._predicate
 
     @property
-    def names(self) -> set[str]:
-        """Return a tuple of names in self.content."""
-        return {o for o in self.objects if len(o) > 1}
+    def predicates(self) -> list[str]:
+        """Return self.content's predicate in a list."""
+        return [self._predicate]
 
-    @property
-    def unbound_variables(self) -> tuple[str]:
-        """Return a tuple of unbound variables in self.content."""
-        variables = [o for o in set(self.objects) if len(o) == 1]
+    def _measure_complexity(self) -> int:
+        return 0
+
+    def _collect_names(self) -> frozenset[str]:
+        names = [o for o in self._objects if len(o) > 1]
+        return frozenset(names) if names else NO_NAMES
+
+    def _collect_unbound_variables(self) -> tuple[str, ...]:
+        variables = [o for o in set(self._objects) if len(o) == 1]
         return tuple(sorted(variables))
 
-    def instantiate(self, variable: str, name: str) -> Self:
+    def substitute(self, variable: str, name: str) -> Self:
         """
         Return an atom whose instances of variable are replaced with
-        name.
+        name. If variable does not occur in self, return self.
         """
-        # Replace variable instances with name
-        new_objects = [
-            name if o == variable else o for o in self.objects
-        ]
-
-        # Put new objects into a new string for Atom creation
-        new_content = f"{self.predicates[0]}<{', '.join(new_objects)}>"
-
-        return Atom(new_content)
+        if variable not in self._objects:
+            return self
+        new_objects = tuple(
+            name if o == variable else o for o in self._objects
+        )
+        return Atom.from_parts(self._predicate, new_objects)
+
+    def substitution(self, variable: str) -> Callable[[str], Self]:
+        if variable not in self._objects:
+            return lambda name: self
+        predicate, objects = self._predicate, self._objects
+        positions = [i for i, o in enumerate(objects) if o == variable]
+
+        def stamp(name: str) -> Atom:
+            new_objects = list(objects)
+            for i in positions:
+                new_objects[i] = name
+            return Atom.from_parts(predicate, tuple(new_objects))
+
+        return stamp
+
+    @classmethod
+    def from_parts(cls, predicate: str, objects: tuple[str, ...]) -> Self:
+        """
+        Return the atom predicate<objects>, without parsing its string.
+        """
+        string = f"{predicate}<{', '.join(objects)}>"
+        if intern_table is not None and (atom := intern_table.get(cls, string)):
+            return atom
+        atom = object.__new__(cls)
+        object.__setattr__(atom, 'prop', string)
+        object.__setattr__(atom, '_predicate', predicate)
+        object.__setattr__(atom, '_objects', objects)
+        atom._cache_metrics()
+        if intern_table is not None:
+            intern_table.add(atom)
+        return atom
 
 
 @dataclass(slots=True, frozen=True, order=True)
@@ -351,3 +506,110 @@ class Disjunction(BinaryProposition):
     """
     symb = 'v'
     word = 'or'
+
+
+# Each dataclass above generates its own __hash__, which rehashes the
+# whole proposition on every call. Use the cached hash instead.
+for _cls in (UnaryProposition, Quantifier, BinaryProposition, Atom, Universal,
+             Existential, Negation, Conjunction, Conditional, Disjunction):
+    _cls.__hash__ = Proposition.__hash__
+
+
+class InternTable:
+    """
+    Flyweight registry of propositions, keyed on class and content.
+
+    Atoms are keyed on their string, and every other proposition on its
+    class, its bound variable (for quantifiers), and the identities of
+    its already-interned subpropositions, so looking up a proposition
+    whose content is interned costs the same regardless of its size.
+    """
+    def __init__(self) -> None:
+        self.table: dict[tuple, Proposition] = {}
+        # Interned propositions by id(), to recognise them in O(1).
+        self.members: dict[int, Proposition] = {}
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, prop) -> bool:
+        return self.members.get(id(prop)) is prop
+
+    def intern(self, prop: Proposition) -> Proposition:
+        """Return the shared proposition structurally equal to prop."""
+        if prop in self:
+            return prop
+        if not isinstance(prop, Proposition):
+            raise TypeError(f'Cannot intern {type(prop)}, only propositions.')
+        return self.make(prop.__class__, *prop.arguments)
+
+    def make(self, cls: type[Proposition], *content) -> Proposition:
+        """
+        Return the shared instance of cls with content, creating it if
+        this table does not hold one yet.
+        """
+        content = tuple(
+            self.intern(c) if isinstance(c, Proposition) else c
+            for c in content
+        )
+        try:
+            return self.table[self._key(cls, content)]
+        except KeyError:
+            return self.add(cls(*content))
+
+    def get(self, cls: type[Proposition], *content) -> Proposition | None:
+        """
+        Return the shared instance of cls with content, which must
+        already be interned, or None if this table does not hold one.
+        """
+        return self.table.get(self._key(cls, content))
+
+    def add(self, prop: Proposition) -> Proposition:
+        """
+        Store prop, whose content must already be interned, unless an
+        equal proposition is stored already. Return the stored one.
+        """
+        key = self._key(prop.__class__, prop.arguments)
+        prop = self.table.setdefault(key, prop)
+        self.members[id(prop)] = prop
+        return prop
+
+    @staticmethod
+    def _key(cls: type[Proposition], content: tuple) -> tuple:
+        return (cls,) + tuple(
+            id(c) if isinstance(c, Proposition) else c for c in content
+        )
+
+    def clear(self) -> None:
+        """Forget every interned proposition."""
+        self.table.clear()
+        self.members.clear()
+
+
+# The table propositions are interned into, or None if interning is off.
+intern_table: InternTable | None = None
+
+
+def start_interning(table: InternTable = None) -> InternTable:
+    """
+    Switch interning on, using table if given or a fresh InternTable
+    otherwise, and return the table in use.
+    """
+    global intern_table
+    intern_table = InternTable() if table is None else table
+    return intern_table
+
+
+def stop_interning() -> None:
+    """Switch interning off. Interned propositions stay valid."""
+    global intern_table
+    intern_table = None
+
+
+def make(cls: type[Proposition], *content) -> Proposition:
+    """
+    Return cls(*content), or its shared instance if interning is on.
+    """
+    if intern_table is None:
+        return cls(*content)
+    return intern_table.make(cls, *content)
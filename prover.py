@@ -10,17 +10,58 @@ If any first-order propositions appear in the solver's input data, but
 none of them have names and no names are passed in to the initializer,
 then all quantified propositions will be instantiated with the 'NONE'
 non-name.
+
+The roots may also be given as a lazy iterable (e.g. the generator
+returned by convert.iter_sequents), in which case they are only
+consumed by .run(), and proving starts as soon as the first of them
+is available. Since the prover cannot look ahead at the names in roots
+it has not yet seen, each root is then proved with the names passed in
+to the initializer plus the names in that root. The names of each root
+are added to .names as it is recorded.
+
+Prover.from_lines() goes one step further and hands the unparsed lines
+of an input file to the worker processes, which parse and prove them
+in one go. Lines that can't be parsed are recorded in .errors as
+(line number, message) pairs. If the lines are a sequence (e.g. a
+list), their names are picked out up front (see
+convert.names_in_lines), so that, as for a sequence of roots, every
+root is proved with the names of them all.
+
+With memoize=True, every tree grown by a process during a run shares a
+TreeMemo, so identical subproblems (within a tree or across roots) are
+grown once. Trees proved by the same worker process are only shared
+with each other while they're in that process, though: trees coming
+back from the pool in different chunks are separate copies.
+
+The rules used are those set when .run() is called, unless a
+rules.RuleTable is passed in as rules. Either way they are looked up
+once and sent along with the roots to the processes that prove them.
+
+With check=True, the prover only works out whether each root is
+provable (see Tree.is_provable), without growing whole trees, and
+records the answers in .results rather than trees in .forest. Pruning
+only knows about identities, so it can't be combined with a base.
 """
 
 __all__ = ['Prover']
 
 
+import functools
 import itertools
 
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from multiprocessing import Pool
 
 import convert
 from sequent import Sequent
+from rules import RuleTable
+from tree import Tree, TreeMemo, in_base, is_identity
+
+# Number of roots (or lines) sent to a worker process at a time.
+CHUNKSIZE = 16
+
+# Memo for the trees grown by this process during a run, if memoizing.
+_memo: TreeMemo | None = None
 
 
 class Prover:
@@ -28,25 +69,102 @@ class Prover:
     Class for converting a list of strings representing sequents into
     sequent objects and then turning those objects into trees.
     """
-    def __init__(self, roots: list[Sequent], names: set = None) -> None:
+    def __init__(self, roots: Iterable[Sequent], names: set = None,
+                 prune: bool = False, memoize: bool = False,
+                 check: bool = False, base: Iterable[Sequent] = None,
+                 rules: RuleTable = None) -> None:
+        if prune and base is not None:
+            raise ValueError('Pruning only keeps splits that close by identity, '
+                             'so it cannot be used with a base.')
         if names is None:
             names = set()
         self.names = names
+        self.rules = rules
+        self.prune = prune
+        self.memoize = memoize
+        self.check = check
+        self.base = None if base is None else frozenset(base)
 
-        self.roots = roots
-
-        names_in_roots = {name for sequent in roots for name in sequent.names}
-        self.names.update(names_in_roots)
-        if not self.names:
-            self.names = {'NONE'}
+        if isinstance(roots, Sequence):
+            self.roots = roots
+            self._pending = None
+            names_in_roots = {name for sequent in roots for name in sequent.names}
+            self.names.update(names_in_roots)
+            if not self.names:
+                self.names = {'NONE'}
+        else:
+            # Roots are recorded as they are proved.
+            self.roots = []
+            self._pending = roots
 
+        self._lines = None
+        self.errors = []
         self.forest = []
+        self.results = []
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], names: set = None, **options) -> 'Prover':
+        """
+        Return a prover for the sequents written on lines, which are
+        parsed by the same processes that prove them. Options are as
+        for the initializer.
+        """
+        prover = cls(roots=iter(()), names=names, **options)
+        prover._lines = lines
+        if isinstance(lines, Sequence):
+            prover.names.update(convert.names_in_lines(lines))
+            if not prover.names:
+                prover.names = {'NONE'}
+        return prover
 
     def run(self) -> None:
         """
         Turn each sequent in self.roots into a full tree and add it to 
-        the forest. Uses parallel processing if there are sufficiently
-        many trees to prove.
+        the forest, or in check mode, add whether it is provable to
+        self.results. Uses parallel processing if there are
+        sufficiently many trees to prove.
+        """
+        # The rules are looked up once, here, and sent to every worker.
+        if self.rules is None:
+            self.rules = RuleTable.from_settings()
+        # Names are copied, since those of lazy roots are added to
+        # self.names as they are recorded.
+        options = {
+            'names': frozenset(self.names),
+            'prune': self.prune,
+            'check': self.check,
+            'base': self.base,
+            'rule_table': self.rules
+        }
+        # Roots that were given up front are already in self.roots, but
+        # lazy roots are recorded as they are proved.
+        if self._lines is not None:
+            items, self._lines = convert.iter_sequent_lines(self._lines), None
+            work = functools.partial(parse_and_prove, **options)
+            record_roots = True
+        elif self._pending is not None:
+            items, self._pending = self._pending, None
+            work = functools.partial(prove_root, **options)
+            record_roots = True
+        else:
+            items = iter(self.roots)
+            work = functools.partial(prove_root, **options)
+            record_roots = False
+
+        outcomes = self.results if self.check else self.forest
+        for root, outcome, error in self._map(work, items):
+            if error is not None:
+                self.errors.append(error)
+                continue
+            if record_roots:
+                self.roots.append(root)
+                self.names.update(root.names)
+            outcomes.append(outcome)
+
+    def _map(self, func: Callable, items: Iterator) -> Iterator:
+        """
+        Yield func(item) for each of items, in order, farming them out
+        to a process pool if there are sufficiently many of them.
         """
         # 10 seems like an okay number to start, but at some point I
         # want to figure out what a good cutoff is, where the benefits
@@ -55,20 +173,95 @@ class Prover:
         # I want to be able to throw unbounded numbers of sequents into
         # this without it taking a year to decompose them all,
         # especially if any non-invertible rules are in use.
-        if len(self.roots) > 10:
-            with Pool() as pool:
-                results = pool.starmap(convert.sequent_to_tree, ((root, self.names) for root in self.roots))
-        else:
-            results = itertools.starmap(convert.sequent_to_tree, ((root, self.names) for root in self.roots))
-        self.forest.extend(results)
+        head = list(itertools.islice(items, 11))
+        if len(head) <= 10:
+            if self.memoize:
+                start_memo(self.rules)
+            try:
+                yield from map(func, head)
+            finally:
+                stop_memo()
+            return
+
+        # Items are pulled from their iterable by the pool's task
+        # handler thread, so lazy items are produced while earlier ones
+        # are being worked on, and results come back in order.
+        initializer = start_memo if self.memoize else None
+        with Pool(initializer=initializer, initargs=(self.rules,)) as pool:
+            yield from pool.imap(func, itertools.chain(head, items), CHUNKSIZE)
 
     def export(self) -> dict:
         """
-        Return a dictionary of the prover's names, roots, and solved trees.
+        Return a dictionary of the prover's names, roots, and solved trees
+        (or in check mode, whether each root is provable).
         """
+        if self.check:
+            return {
+                'names': self.names,
+                'sequents': self.roots,
+                'results': self.results
+            }
         return {
             'names': self.names,
             'sequents': self.roots,
             'forest': self.forest
         }
 
+
+def prove(root: Sequent, names: set[str], prune: bool = False,
+          check: bool = False, base: Iterable[Sequent] = None,
+          rule_table: RuleTable = None) -> Tree | bool:
+    """
+    Return the fully grown tree of root, using a copy of names so that
+    names found in root are not shared with other roots. If check is
+    True, return whether the tree is provable instead, with the
+    sequents in base (if given) counting as axioms besides identities.
+    """
+    tree = convert.sequent_to_tree(
+        root, set(names), grow=not check, prune=prune, memo=_memo, rule_table=rule_table
+    )
+    if check:
+        return tree.is_provable(is_identity if base is None else in_base(base))
+    return tree
+
+
+def prove_root(root: Sequent, names: set[str], prune: bool = False,
+               check: bool = False, base: Iterable[Sequent] = None,
+               rule_table: RuleTable = None) -> tuple[Sequent, Tree | bool, None]:
+    """
+    Return root, what prove() returns for it, and None (for the error
+    parse_and_prove would give).
+    """
+    return root, prove(root, names, prune, check, base, rule_table), None
+
+
+def parse_and_prove(numbered_line: tuple[int, str], names: set[str],
+                    prune: bool = False, check: bool = False,
+                    base: Iterable[Sequent] = None, rule_table: RuleTable = None
+                    ) -> tuple[Sequent | None, Tree | bool | None, tuple[int, str] | None]:
+    """
+    Return the sequent on numbered_line, what prove() returns for it,
+    and None, or if the line couldn't be parsed, None, None, and the
+    line number with the reason why.
+    """
+    line_number, line = numbered_line
+    try:
+        root = convert.string_to_sequent(line)
+    except ValueError as error:
+        return None, None, (line_number, str(error))
+    return prove_root(root, names, prune, check, base, rule_table)
+
+
+def start_memo(rule_table: RuleTable = None) -> None:
+    """
+    Share a new TreeMemo, growing trees with rule_table, between the
+    trees this process proves.
+    """
+    global _memo
+    _memo = TreeMemo(rule_table)
+
+
+def stop_memo() -> None:
+    """Stop sharing trees, freeing this process's TreeMemo."""
+    global _memo
+    _memo = None
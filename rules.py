@@ -1,7 +1,10 @@
-from typing import Protocol, TypeVar
+import functools
 
-from proposition import Proposition, Conjunction, Disjunction, Negation, \
-    Conditional, Quantifier, Universal, Existential
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterator, Protocol, TypeVar
+
+from proposition import Proposition, Atom, Conjunction, Disjunction, \
+    Negation, Conditional, Universal, Existential
 from sequent import Sequent
 from settings import Settings
 
@@ -22,6 +25,9 @@ class Rule(Protocol):
     def apply(self) -> decomp_result:
         ...
 
+    def iter_apply(self) -> Iterator[tuple[Sequent] | tuple[Sequent, Sequent]]:
+        ...
+
 
 class LeftMultAnd:
     invertible = True
@@ -32,11 +38,10 @@ class LeftMultAnd:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent]]:
-        prop_sequent = Sequent(
-            ant=(self.proposition.left, self.proposition.right),
-            con=None
-        )
-        return (self.sequent.mix(prop_sequent),),
+        return (self.sequent.extend(ant=(self.proposition.left, self.proposition.right)),),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        return iter(self.apply())
 
 
 class LeftAddAnd:
@@ -48,11 +53,11 @@ class LeftAddAnd:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        parents = (
-            Sequent(ant=prop, con=None)
-            for prop in (self.proposition.left, self.proposition.right)
-        )
-        return tuple((self.sequent.mix(parent),) for parent in parents)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in (self.proposition.left, self.proposition.right):
+            yield self.sequent.extend(ant=(prop,)),
 
 
 class RightAddAnd:
@@ -64,29 +69,32 @@ class RightAddAnd:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent, Sequent]]:
-        left = Sequent(ant=None, con=self.proposition.left)
-        right = Sequent(ant=None, con=self.proposition.right)
-        return tuple(self.sequent.mix(parent) for parent in (left, right)),  # type: ignore
+        return (
+            self.sequent.extend(con=(self.proposition.left,)),
+            self.sequent.extend(con=(self.proposition.right,))
+        ),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return iter(self.apply())
 
 
 class RightMultAnd:
     invertible = False
     parents = 2
 
-    def __init__(self, proposition: Conjunction, sequent: Sequent) -> None:
+    def __init__(self, proposition: Conjunction, sequent: Sequent,
+                 prune: bool = False, right_add_if: bool = False) -> None:
         self.proposition = proposition
         self.sequent = sequent
+        self.prune = prune
+        self.right_add_if = right_add_if
+        self.pruned = 0
 
     def apply(self) -> tuple[tuple[Sequent, Sequent], ...]:
-        left_parent = Sequent(ant=None, con=self.proposition.left)
-        right_parent = Sequent(ant=None, con=self.proposition.right)
-        results = (
-            (left_parent.mix(left), right_parent.mix(right))
-            for left, right in self.sequent.possible_mix_parents()
-        )
-        if not results:
-            return tuple((left_parent, right_parent)),
-        return tuple(results)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return _split_context(self, 'con', 'con')
 
 
 class RightMultOr:
@@ -98,8 +106,10 @@ class RightMultOr:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent]]:
-        prop_sequent = Sequent(ant=None, con=(self.proposition.left, self.proposition.right))
-        return (self.sequent.mix(prop_sequent),),
+        return (self.sequent.extend(con=(self.proposition.left, self.proposition.right)),),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        return iter(self.apply())
 
 
 class RightAddOr:
@@ -111,11 +121,11 @@ class RightAddOr:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        parents = (
-            Sequent(ant=None, con=prop)
-            for prop in (self.proposition.left, self.proposition.right)
-        )
-        return tuple((self.sequent.mix(parent),) for parent in parents)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in (self.proposition.left, self.proposition.right):
+            yield self.sequent.extend(con=(prop,)),
 
 
 class LeftAddOr:
@@ -127,29 +137,32 @@ class LeftAddOr:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent, Sequent]]:
-        left = Sequent(ant=self.proposition.left, con=None)
-        right = Sequent(ant=self.proposition.right, con=None)
-        return tuple(self.sequent.mix(parent) for parent in (left, right)),  # type: ignore
+        return (
+            self.sequent.extend(ant=(self.proposition.left,)),
+            self.sequent.extend(ant=(self.proposition.right,))
+        ),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return iter(self.apply())
 
 
 class LeftMultOr:
     invertible = False
     parents = 2
 
-    def __init__(self, proposition: Disjunction, sequent: Sequent) -> None:
+    def __init__(self, proposition: Disjunction, sequent: Sequent,
+                 prune: bool = False, right_add_if: bool = False) -> None:
         self.proposition = proposition
         self.sequent = sequent
+        self.prune = prune
+        self.right_add_if = right_add_if
+        self.pruned = 0
 
     def apply(self) -> tuple[tuple[Sequent, Sequent], ...]:
-        left_parent = Sequent(ant=self.proposition.left, con=None)
-        right_parent = Sequent(ant=self.proposition.right, con=None)
-        results = (
-            (left_parent.mix(left), right_parent.mix(right))
-            for left, right in self.sequent.possible_mix_parents()
-        )
-        if not results:
-            return tuple((left_parent, right_parent)),
-        return tuple(results)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return _split_context(self, 'ant', 'ant')
 
 
 class RightMultIf:
@@ -161,8 +174,12 @@ class RightMultIf:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent]]:
-        prop_sequent = Sequent(ant=self.proposition.left, con=self.proposition.right)
-        return (self.sequent.mix(prop_sequent),),
+        return (
+            self.sequent.extend(ant=(self.proposition.left,), con=(self.proposition.right,)),
+        ),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        return iter(self.apply())
 
 
 class RightAddIf:
@@ -174,9 +191,11 @@ class RightAddIf:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        left_parent = Sequent(ant=None, con=self.proposition.left)
-        right_parent = Sequent(ant=self.proposition.right, con=None)
-        return tuple((self.sequent.mix(parent),) for parent in (left_parent, right_parent))
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        yield self.sequent.extend(con=(self.proposition.left,)),
+        yield self.sequent.extend(ant=(self.proposition.right,)),
 
 
 class LeftAddIf:
@@ -188,29 +207,32 @@ class LeftAddIf:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent, Sequent]]:
-        left = Sequent(ant=None, con=self.proposition.left)
-        right = Sequent(ant=self.proposition.right, con=None)
-        return tuple(self.sequent.mix(parent) for parent in (left, right)),  # type: ignore
+        return (
+            self.sequent.extend(con=(self.proposition.left,)),
+            self.sequent.extend(ant=(self.proposition.right,))
+        ),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return iter(self.apply())
 
 
 class LeftMultIf:
     invertible = False
     parents = 2
 
-    def __init__(self, proposition: Conditional, sequent: Sequent) -> None:
+    def __init__(self, proposition: Conditional, sequent: Sequent,
+                 prune: bool = False, right_add_if: bool = False) -> None:
         self.proposition = proposition
         self.sequent = sequent
+        self.prune = prune
+        self.right_add_if = right_add_if
+        self.pruned = 0
 
     def apply(self) -> tuple[tuple[Sequent, Sequent], ...]:
-        left_parent = Sequent(ant=None, con=self.proposition.left)
-        right_parent = Sequent(ant=self.proposition.right, con=None)
-        results = (
-            (left_parent.mix(left), right_parent.mix(right))
-            for left, right in self.sequent.possible_mix_parents()
-        )
-        if not results:
-            return tuple((left_parent, right_parent)),
-        return tuple(results)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent, Sequent]]:
+        return _split_context(self, 'con', 'ant')
 
 
 class LeftNot:
@@ -222,8 +244,10 @@ class LeftNot:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent]]:
-        prop_sequent = Sequent(ant=None, con=self.proposition.prop)
-        return (self.sequent.mix(prop_sequent),),
+        return (self.sequent.extend(con=(self.proposition.prop,)),),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        return iter(self.apply())
 
 
 class RightNot:
@@ -235,8 +259,10 @@ class RightNot:
         self.sequent = sequent
 
     def apply(self) -> tuple[tuple[Sequent]]:
-        prop_sequent = Sequent(ant=self.proposition.prop, con=None)
-        return (self.sequent.mix(prop_sequent),),
+        return (self.sequent.extend(ant=(self.proposition.prop,)),),
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        return iter(self.apply())
 
 
 class LeftForall:
@@ -245,17 +271,17 @@ class LeftForall:
 
     def __init__(self, proposition: Universal, sequent: Sequent, names: set[str]):
         if not names:
-            names.add('NONE')
+            names = {'NONE'}
         self.proposition = proposition
         self.sequent = sequent
         self.names = names
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        prop_sequents = (
-            Sequent(ant=self.proposition.instantiate_with(name), con=None)
-            for name in self.names
-        )
-        return tuple((self.sequent.mix(sequent),) for sequent in prop_sequents)  # type: ignore
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in self.proposition.instantiate_many(self.names):
+            yield self.sequent.extend(ant=(prop,)),
 
 
 class RightForall:
@@ -273,11 +299,11 @@ class RightForall:
         self.names = legal_names
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        prop_sequents = (
-            Sequent(ant=None, con=self.proposition.instantiate_with(name))
-            for name in self.names
-        )
-        return tuple((self.sequent.mix(sequent),) for sequent in prop_sequents)  # type: ignore
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in self.proposition.instantiate_many(self.names):
+            yield self.sequent.extend(con=(prop,)),
 
 
 class LeftExists:
@@ -286,17 +312,17 @@ class LeftExists:
 
     def __init__(self, proposition: Existential, sequent: Sequent, names: set[str]):
         if not names:
-            names.add('NONE')
+            names = {'NONE'}
         self.proposition = proposition
         self.sequent = sequent
         self.names = names
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        prop_sequents = (
-            Sequent(ant=self.proposition.instantiate_with(name), con=None)
-            for name in self.names
-        )
-        return tuple((self.sequent.mix(sequent),) for sequent in prop_sequents)
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in self.proposition.instantiate_many(self.names):
+            yield self.sequent.extend(ant=(prop,)),
 
 
 class RightExists:
@@ -305,17 +331,167 @@ class RightExists:
 
     def __init__(self, proposition: Existential, sequent: Sequent, names: set[str]):
         if not names:
-            names.add('NONE')
+            names = {'NONE'}
         self.proposition = proposition
         self.sequent = sequent
         self.names = names
 
     def apply(self) -> tuple[tuple[Sequent], ...]:
-        prop_sequents = (
-            Sequent(ant=None, con=self.proposition.instantiate_with(name))
-            for name in self.names
+        return tuple(self.iter_apply())
+
+    def iter_apply(self) -> Iterator[tuple[Sequent]]:
+        for prop in self.proposition.instantiate_many(self.names):
+            yield self.sequent.extend(con=(prop,)),
+
+
+# Rules which can skip context splits that cannot close.
+PRUNABLE_RULES = RightMultAnd, LeftMultOr, LeftMultIf
+
+# One-parent rules with a branch for each subproposition.
+TWO_BRANCH_RULES = LeftAddAnd, RightAddOr, RightAddIf
+
+# Rules with a branch for each name.
+QUANTIFIER_RULES = LeftForall, RightForall, LeftExists, RightExists
+
+
+def _split_context(rule: RightMultAnd | LeftMultOr | LeftMultIf,
+                   left_side: str, right_side: str) -> Iterator[tuple[Sequent, Sequent]]:
+    """
+    Yield each pair of parents of a two-parent multiplicative rule: the
+    rule's context split every possible way, with the left and right
+    subpropositions of its proposition added to the front of left_side
+    of the first parent and right_side of the second.
+
+    If rule.prune is set, pairs in which either parent can't be closed
+    (see can_close, which is told whether conditionals in the consequent
+    are decomposed by RightAddIf by rule.right_add_if) are left out and
+    counted in rule.pruned once every pair has been yielded. At least
+    one pair is always kept so that the rule still has a result.
+    """
+    # Each parent is built once, straight from its share of the context.
+    left_ant, left_con = _prefixes(left_side, rule.proposition.left)
+    right_ant, right_con = _prefixes(right_side, rule.proposition.right)
+    pairs = (
+        (
+            Sequent(left_ant + ant_first, left_con + con_first),
+            Sequent(right_ant + ant_second, right_con + con_second)
         )
-        return tuple((self.sequent.mix(sequent),) for sequent in prop_sequents)
+        for (ant_first, con_first), (ant_second, con_second)
+        in rule.sequent.iter_mix_splits()
+    )
+    if not rule.prune:
+        yield from pairs
+        return
+
+    def closable(pair: tuple[Sequent, Sequent]) -> bool:
+        return all(can_close(parent, rule.right_add_if) for parent in pair)
+
+    first = next(pairs)
+    kept = 0
+    if closable(first):
+        kept += 1
+        yield first
+    for pair in pairs:
+        if closable(pair):
+            kept += 1
+            yield pair
+    if not kept:
+        kept += 1
+        yield first
+    rule.pruned = rule.sequent.count_mix_parents() - kept
+
+
+def _prefixes(side: str, prop: Proposition
+              ) -> tuple[tuple[Proposition, ...], tuple[Proposition, ...]]:
+    # Return what to put before a parent's antecedent and consequent to
+    # add prop to the front of side.
+    return ((prop,), ()) if side == 'ant' else ((), (prop,))
+
+
+def can_close(sequent: Sequent, right_add_if: bool = False) -> bool:
+    """
+    Return whether sequent might decompose into atomic sequents closed
+    by identity, i.e. whether some atom could end up in both its
+    antecedent and its consequent.
+
+    Where each atom would end up (its polarity) is fixed by where it
+    is in sequent (see signed_atoms), so that is only possible if some
+    atom occurs with both polarities. right_add_if is whether
+    conditionals in the consequent are decomposed by RightAddIf. Atoms
+    with objects are compared by predicate alone, since instantiation
+    can change their objects.
+    """
+    polarities = {}
+    for side, positive in ((sequent.ant, False), (sequent.con, True)):
+        for prop in side:
+            for key, polarity in signed_atoms(prop, positive, right_add_if):
+                polarities.setdefault(key, set()).add(polarity)
+    return any(len(signs) == 2 for signs in polarities.values())
+
+
+@functools.lru_cache(maxsize=2 ** 16)
+def signed_atoms(prop: Proposition, positive: bool = True,
+                 right_add_if: bool = False) -> frozenset[tuple[str, bool]]:
+    """
+    Return the atoms in prop, keyed by predicate for atoms with objects,
+    with whether each would end up in the consequent if prop were in
+    the consequent (positive) or the antecedent (not positive).
+
+    Negations, and every rule for conditionals but one, move the
+    negated proposition or the conditional's antecedent to the other
+    side. The exception is RightAddIf (used for conditionals in the
+    consequent if right_add_if is True), which puts the antecedent in
+    the consequent and the consequent in the antecedent.
+    """
+    if isinstance(prop, Atom):
+        return frozenset({(prop.predicate if prop.objects else prop.prop, positive)})
+    if isinstance(prop, Negation):
+        return signed_atoms(prop.prop, not positive, right_add_if)
+    if isinstance(prop, Conditional):
+        if positive and right_add_if:
+            return (signed_atoms(prop.left, True, right_add_if)
+                    | signed_atoms(prop.right, False, right_add_if))
+        return (signed_atoms(prop.left, not positive, right_add_if)
+                | signed_atoms(prop.right, positive, right_add_if))
+    return frozenset().union(*(signed_atoms(p, positive, right_add_if) for p in prop.content))
+
+
+def branching(rule: Rule) -> int:
+    """
+    Return how many branches (possible ways its parents might be) rule
+    gives the tree it decomposes, without applying it. This is exact
+    unless rule prunes, in which case it is an upper bound.
+    """
+    if isinstance(rule, PRUNABLE_RULES):
+        return rule.sequent.count_mix_parents()
+    if isinstance(rule, QUANTIFIER_RULES):
+        return len(rule.names)
+    if isinstance(rule, TWO_BRANCH_RULES):
+        return 2
+    return 1
+
+
+def is_invertible_step(rule: Rule) -> bool:
+    """
+    Return whether rule is invertible and gives its tree one branch
+    with one parent, so that there is nothing to choose between.
+    """
+    return rule.invertible and rule.parents == 1 and branching(rule) == 1
+
+
+# Ways of choosing which complex proposition of a sequent to decompose,
+# each a key by which the rules for its complex propositions are ranked.
+# Ties (and every choice of 'leftmost') go to the leftmost proposition.
+# Multiplicative rules split the rest of the sequent between parents, so
+# the order can change which splits a tree has, not only its size.
+SELECTION_STRATEGIES: dict[str, Callable[[Rule], tuple]] = {
+    'leftmost': lambda rule: (),
+    # RightAddOr is flagged invertible but has two branches, so rules
+    # only count as invertible here if they leave nothing to choose.
+    'invertible': lambda rule: (not (rule.invertible and branching(rule) == 1),),
+    'fewest-branches': lambda rule: (branching(rule),),
+    'smallest': lambda rule: (rule.proposition.complexity,),
+}
 
 
 RULE_DICT = {
@@ -350,7 +526,124 @@ RULE_DICT = {
 }
 
 
-def get_rule(sequent: Sequent, names: set[str] = None) -> Rule:
+@dataclass(frozen=True, slots=True)
+class RuleTable:
+    """
+    Immutable snapshot of which rule ('add' or 'mul') decomposes each
+    connective on each side, compiled into a flat mapping from (side,
+    connective symbol) to a function making the rule.
+
+    .strategy names the way the proposition to decompose is chosen
+    (see SELECTION_STRATEGIES): 'leftmost' (the first complex
+    proposition), 'invertible' (invertible rules first),
+    'fewest-branches' (rules giving the fewest branches first, see
+    branching) or 'smallest' (least complex propositions first).
+
+    If .compress is set, trees grown with the table apply each run of
+    invertible one-parent rules (see is_invertible_step) in one step
+    (see Tree.steps).
+
+    Tables compare, hash and pickle as their .types, .strategy and
+    .compress alone, so they are cheap to send to worker processes and
+    to use as (part of) a key.
+    >>> table = RuleTable.from_settings(strategy='invertible')
+    >>> rule = table.rule_for(convert.string_to_sequent('A & B; C'))
+    """
+    types: tuple[tuple[str, str, str], ...]
+    strategy: str = 'leftmost'
+    compress: bool = False
+    rules: dict[tuple[str, str], Callable[..., Rule]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.strategy not in SELECTION_STRATEGIES:
+            raise ValueError(f'Unknown selection strategy: {self.strategy}.')
+        compiled = {}
+        right_add_if = ('con', '->', 'add') in self.types
+        for side, connective, rule_type in self.types:
+            rule = RULE_DICT[side][connective][rule_type]
+            if connective in QUANTIFIER_SYMBOLS:
+                compiled[side, connective] = functools.partial(_make_quantifier_rule, rule)
+            elif rule in PRUNABLE_RULES:
+                compiled[side, connective] = functools.partial(
+                    _make_prunable_rule, rule, right_add_if=right_add_if
+                )
+            else:
+                compiled[side, connective] = functools.partial(_make_rule, rule)
+        object.__setattr__(self, 'rules', compiled)
+
+    def __reduce__(self) -> tuple:
+        return RuleTable, (self.types, self.strategy, self.compress)
+
+    @classmethod
+    def from_settings(cls, strategy: str = 'leftmost', compress: bool = False) -> 'RuleTable':
+        """Return a table of the rules currently set in settings."""
+        settings = Settings()
+        return cls(tuple(
+            (side, connective, settings.get_rule(connective=connective, side=side))
+            for side, connectives in RULE_DICT.items()
+            for connective in connectives
+        ), strategy, compress)
+
+    def override(self, side: str, connective: str, rule_type: str) -> 'RuleTable':
+        """
+        Return a copy of this table using rule_type ('add' or 'mul') for
+        connective on side, e.g. for a single run, without changing the
+        settings.
+        """
+        if rule_type not in RULE_DICT.get(side, {}).get(connective, {}):
+            raise ValueError(f'Unknown rule: {side} {connective} {rule_type}.')
+        return replace(self, types=tuple(
+            (s, c, rule_type if (s, c) == (side, connective) else t)
+            for s, c, t in self.types
+        ))
+
+    def with_strategy(self, strategy: str) -> 'RuleTable':
+        """Return a copy of this table using strategy."""
+        return replace(self, strategy=strategy)
+
+    def with_compression(self, compress: bool = True) -> 'RuleTable':
+        """Return a copy of this table which compresses (or doesn't)."""
+        return replace(self, compress=compress)
+
+    def rule_for(self, sequent: Sequent, names: set[str] = None,
+                 prune: bool = False) -> Rule:
+        """
+        Return the rule which decomposes the complex proposition of
+        sequent chosen by self.strategy, as described in get_rule.
+        """
+        if self.strategy == 'leftmost':
+            return self._make_rule(sequent, *sequent.first_complex_prop(), names, prune)
+        candidates = (
+            self._make_rule(sequent, prop, side, index, names, prune)
+            for prop, side, index in sequent.complex_props()
+        )
+        return min(candidates, key=SELECTION_STRATEGIES[self.strategy])
+
+    def _make_rule(self, sequent: Sequent, prop: Proposition, side: str, index: int,
+                   names: set[str], prune: bool) -> Rule:
+        make_rule = self.rules[side, prop.symb]
+        return make_rule(prop, sequent.remove_proposition_at(side, index), names, prune)
+
+
+QUANTIFIER_SYMBOLS = Universal.symb, Existential.symb
+
+
+def _make_rule(rule, prop, sequent, names, prune) -> Rule:
+    return rule(prop, sequent)
+
+
+def _make_prunable_rule(rule, prop, sequent, names, prune, right_add_if=False) -> Rule:
+    return rule(prop, sequent, prune=prune, right_add_if=right_add_if)
+
+
+def _make_quantifier_rule(rule, prop, sequent, names, prune) -> Rule:
+    return rule(prop, sequent, names)
+
+
+def get_rule(sequent: Sequent, names: set[str] = None, prune: bool = False,
+             table: RuleTable = None, strategy: str = None) -> Rule:
     """
     Return an object following the Rule protocol based on sequent. Rules
     are either invertible or not and have either 1 or 2 parents.
@@ -366,11 +659,20 @@ def get_rule(sequent: Sequent, names: set[str] = None) -> Rule:
         - One-parent non-invertible -> tuple[tuple[Sequent], ...]
         - Two-parent non-invertible -> tuple[tuple[Sequent, Sequent], ...]
 
+    Rule.iter_apply() yields the same tuples of Sequents one at a time,
+    so non-invertible rules only make the decompositions that are asked
+    for.
+
+    If prune is True, two-parent multiplicative rules leave out pairs of
+    parents that cannot both be closed and count them in Rule.pruned.
+
+    Rules are looked up in table, or if no table is given, in a new one
+    compiled from the current settings. The proposition decomposed is
+    chosen by strategy if given, and otherwise by table.strategy (see
+    RuleTable).
     """
-    prop, side, index = sequent.first_complex_prop()
-    sequent_minus_prop = sequent.remove_proposition_at(side, index)
-    rule_type = Settings().get_rule(connective=prop.symb, side=side)
-    rule = RULE_DICT[side][prop.symb][rule_type]
-    if isinstance(prop, Quantifier):
-        return rule(prop, sequent_minus_prop, names)
-    return rule(prop, sequent_minus_prop)
+    if table is None:
+        table = RuleTable.from_settings()
+    if strategy is not None:
+        table = table.with_strategy(strategy)
+    return table.rule_for(sequent, names, prune)
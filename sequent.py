@@ -16,6 +16,11 @@ antecedents and likewise for consequents.
 >>> Sequent.mix(s_0, s_1)
 Sequent((Atom('ant_0'), Atom('ant_1')), (Atom('con_0'), Atom('con_1)))
 
+Single propositions can be added to either end of a sequent with
+.extend() and .prepend().
+>>> s_0.extend(con=(Atom('con_1'),))
+Sequent((Atom('ant_0'),), (Atom('con_0'), Atom('con_1')))
+
 Sequents know the location of their first complex prop. The following 
 returns the proposition, which side it's on, and its index in that 
 side. Returns a tuple of three Nones if the sequent is atomic.
@@ -23,6 +28,8 @@ side. Returns a tuple of three Nones if the sequent is atomic.
 >>> s.first_complex_prop()
 Conditional(Atom('p'), Atom('q')), 'con', 0
 
+.complex_props() yields the same for every complex proposition.
+
 Finally, sequents can imperfectly reverse the mixing process. 
 Sequent.possible_mix_parents() returns a list containing each pair
 of sequents that could have been mixed (or combined via two-parent 
@@ -39,29 +46,43 @@ other data types into sequents, I'll add one there.
 __all__ = ['Sequent']
 
 import itertools
+import random
 from dataclasses import dataclass, field
 from typing import Self, Iterable, Generator
 
 from proposition import Proposition
 
 
-@dataclass(slots=True, order=True)
+@dataclass(frozen=True, slots=True, order=True)
 class Sequent:
     ant: tuple[Proposition, ...] | Proposition | None
     con: tuple[Proposition, ...] | Proposition | None
-    _first_complex_prop: tuple[Proposition, str, int] = field(default=None, init=False)
+    _first_complex_prop: tuple[Proposition, str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hash: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Ensure self.ant and self.con contain tuples of propositions
         for attr in 'ant', 'con':
             if getattr(self, attr) is None:
-                setattr(self, attr, ())
+                object.__setattr__(self, attr, ())
                 continue
             if not isinstance(getattr(self, attr), tuple):
                 # Create a list to avoid tuple() using the proposition's
                 # .__iter__() for tuple construction.
                 side = [getattr(self, attr)]
-                setattr(self, attr, tuple(side))
+                object.__setattr__(self, attr, tuple(side))
+
+        # Sequents are immutable, so these are worked out once here
+        # rather than every time they are asked for.
+        object.__setattr__(self, '_first_complex_prop', self._find_first_complex_prop())
+        object.__setattr__(self, '_hash', hash(self.ant + ('|-',) + self.con))
+
+    def __reduce__(self):
+        # The cached hash depends on the interpreter's string hashing,
+        # so it is recomputed on unpickling rather than stored.
+        return Sequent, (self.ant, self.con)
 
     def __iter__(self):
         yield self.ant
@@ -77,7 +98,7 @@ class Sequent:
         What makes a sequent unique is the contents of its antecedent
         and consequent as well as where the divider is between the two.
         """
-        return hash(self.ant + ('|-',) + self.con)
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, Sequent):
@@ -87,11 +108,7 @@ class Sequent:
     @property
     def is_atomic(self) -> bool:
         """Return whether all propositions in self are atomic."""
-        for side in self:
-            for prop in side:
-                if prop.complexity > 0:
-                    return False
-        return True
+        return self._first_complex_prop is None
 
     @property
     def names(self) -> set[str]:
@@ -141,11 +158,30 @@ class Sequent:
         True
         Order matters
         """
+        chain = itertools.chain.from_iterable
         return Sequent(
-            ant=sum((sequent.ant for sequent in sequents), ()),
-            con=sum((sequent.con for sequent in sequents), ())
+            ant=tuple(chain(sequent.ant for sequent in sequents)),
+            con=tuple(chain(sequent.con for sequent in sequents))
         )
 
+    def extend(self, ant: tuple[Proposition, ...] = (),
+               con: tuple[Proposition, ...] = ()) -> Self:
+        """
+        Return a new sequent with ant added to the end of this one's
+        antecedent and con to the end of its consequent. Equivalent to
+        self.mix(Sequent(ant, con)) without building the middle sequent.
+        """
+        return Sequent(self.ant + ant, self.con + con)
+
+    def prepend(self, ant: tuple[Proposition, ...] = (),
+                con: tuple[Proposition, ...] = ()) -> Self:
+        """
+        Return a new sequent with ant added to the start of this one's
+        antecedent and con to the start of its consequent. Equivalent to
+        Sequent(ant, con).mix(self) without building the middle sequent.
+        """
+        return Sequent(ant + self.ant, con + self.con)
+
     def tag(self) -> str:
         """
         Return a string representing the rule to be applied to the 
@@ -165,17 +201,25 @@ class Sequent:
         side of the sequent it's on, and its index on that side. If
         self.is_atomic, return None.
         """
-        # Check that we haven't already checked this.
-        if self._first_complex_prop is not None:
-            return self._first_complex_prop
+        return self._first_complex_prop
 
+    def complex_props(self) -> Generator[tuple[Proposition, str, int], None, None]:
+        """
+        Yield each complex proposition in the sequent, left to right,
+        with the side of the sequent it's on and its index on that side.
+        """
+        for side in ('ant', 'con'):
+            for i, prop in enumerate(getattr(self, side)):
+                if prop.complexity >= 1:
+                    yield prop, side, i
+
+    def _find_first_complex_prop(self) -> tuple[Proposition, str, int] | None:
         # All these returns are to get around the fact that we want to
         # have a nested for loop (because we both iterate and return side)
         for side in ('ant', 'con'):
             for i, prop in enumerate(getattr(self, side)):
                 if prop.complexity >= 1:
-                    self._first_complex_prop = prop, side, i
-                    return self._first_complex_prop
+                    return prop, side, i
 
         # Explicit `return None` if self.is_atomic.
         # I would call self.is_atomic to check, but actually the implementation
@@ -188,27 +232,102 @@ class Sequent:
         Return a list of all possible parents this sequent may have had
         from an application of mix or another non-invertible rule.
         """
-        combinations = itertools.product(
-            binary_combinations(self.ant),
-            binary_combinations(self.con)
+        return list(self.iter_mix_parents())
+
+    def count_mix_parents(self) -> int:
+        """
+        Return the number of pairs self.possible_mix_parents() would
+        return, without building any of them.
+        """
+        return 2 ** (len(self.ant) + len(self.con))
+
+    def iter_mix_parents(self, limit: int = None,
+                         unordered: bool = False
+                         ) -> Generator[tuple[Self, Self], None, None]:
+        """
+        Lazily yield the pairs in self.possible_mix_parents(), in the
+        same order, stopping after limit pairs if limit is given.
+
+        Each pair of parents also appears swapped. Rules that treat
+        their two parents differently need both, but if unordered is
+        True only the first of each of these pairs (the half in which
+        the first parent gets self's first proposition) is yielded.
+        """
+        pairs = (
+            (Sequent(*first), Sequent(*second))
+            for first, second in self.iter_mix_splits()
         )
-        return [
-            (
-                Sequent(antecedents[0], consequents[0]),
-                Sequent(antecedents[1], consequents[1])
-            )
-            for antecedents, consequents in combinations
-        ]
+        if unordered:
+            half = max(self.count_mix_parents() // 2, 1)
+            limit = half if limit is None else min(limit, half)
+        return itertools.islice(pairs, limit)
+
+    def iter_mix_splits(self) -> Generator[
+            tuple[tuple[tuple, tuple], tuple[tuple, tuple]], None, None]:
+        """
+        Lazily yield the (ant, con) tuples of each pair in
+        self.possible_mix_parents(), in the same order, without building
+        the sequents, for callers that add to them before they do.
+        """
+        for ant_first, ant_second in binary_combinations(self.ant):
+            for con_first, con_second in binary_combinations(self.con):
+                yield (ant_first, con_first), (ant_second, con_second)
+
+    def mix_parents_at(self, index: int) -> tuple[Self, Self]:
+        """
+        Return self.possible_mix_parents()[index] without building the
+        pairs before it.
+        """
+        count = self.count_mix_parents()
+        if not 0 <= index < count:
+            raise IndexError(f'Sequent has {count} pairs of mix parents, not {index + 1}.')
+        # Bits of index, most significant first, say which parent each
+        # proposition goes to (0 for the first, 1 for the second),
+        # antecedent first.
+        first, second = ([], []), ([], [])
+        position = count.bit_length() - 2
+        for side_index, side in enumerate(self):
+            for prop in side:
+                parent = second if index >> position & 1 else first
+                parent[side_index].append(prop)
+                position -= 1
+        return (
+            Sequent(tuple(first[0]), tuple(first[1])),
+            Sequent(tuple(second[0]), tuple(second[1]))
+        )
+
+    def sample_mix_parents(self, k: int, rng: random.Random = None
+                           ) -> list[tuple[Self, Self]]:
+        """
+        Return k distinct pairs from self.possible_mix_parents() chosen
+        at random (or all of them if there are fewer than k), in the
+        order they appear there.
+        """
+        if rng is None:
+            rng = random.Random()
+        count = self.count_mix_parents()
+        if k >= count:
+            return self.possible_mix_parents()
+        # random.sample can't take ranges longer than sys.maxsize, which
+        # the pairs of sequents with 63 or more propositions outnumber.
+        indices = set()
+        while len(indices) < k:
+            indices.add(rng.randrange(count))
+        return [self.mix_parents_at(index) for index in sorted(indices)]
 
 
 def binary_combinations(data: tuple) -> Generator[tuple[tuple, tuple], None, None]:
     """
     Yields all possible ways to split input data into two groups.
     """
-    # Represent which parent had the proposition by allocating True
-    # to one and false to the other (in all combinations).
-    combinations = itertools.product([True, False], repeat=len(data))
-    for combination in combinations:
-        x = [data[i] for i, v in enumerate(combination) if v]
-        y = [data[i] for i, v in enumerate(combination) if not v]
-        yield tuple(x), tuple(y)
\ No newline at end of file
+    # Each number below 2 ** len(data) is one split: the item at i
+    # goes in the second group if bit len(data) - 1 - i is set, which
+    # puts every item in the first group first, as itertools.product
+    # over (True, False) would. Each split is built from scratch, in
+    # O(len(data)), rather than from the one before it.
+    size = len(data)
+    for mask in range(2 ** size):
+        x, y = [], []
+        for i, item in enumerate(data):
+            (y if mask >> (size - 1 - i) & 1 else x).append(item)
+        yield tuple(x), tuple(y)
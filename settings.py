@@ -1,4 +1,6 @@
 import json
+import os
+import tempfile
 
 from collections.abc import MutableMapping
 from pathlib import Path
@@ -16,13 +18,15 @@ class __Settings(MutableMapping):
     Object for storing and maintaining config.json. It's a singleton to
     prevent the possibility of multiple inconsistent Settings objects.
     To access this, the Settings function below should be used.
+
+    Loading the settings only reads config.json; it is written when
+    they are changed (by setting an item, .update() or .set_rule()).
     """
     def __init__(self) -> None:
         super().__init__()
         self.path: Path = CONFIG_PATH
-        self.dict = {}
         with open(self.path, 'r', encoding='utf-8') as cfg:
-            self.update(json.load(cfg))
+            self.dict = json.load(cfg)
 
     def __setitem__(self, key, val) -> None:
         self.dict[key] = val
@@ -63,8 +67,16 @@ class __Settings(MutableMapping):
 
     def save(self) -> None:
         """Save contents of self to config.json."""
-        with open(self.path, 'w') as f:
+        # Written to a temporary file which then replaces config.json,
+        # so that other processes never read a half-written file.
+        directory = Path(self.path).parent
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.json',
+                                         delete=False) as f:
             json.dump(self.dict, f, indent=4)
+        # Temporary files are only readable by their owner, so they are
+        # given the permissions of the file they replace.
+        os.chmod(f.name, _file_mode(self.path))
+        os.replace(f.name, self.path)
 
     def print_rules(self) -> None:
         """Print connective rules to console."""
@@ -80,6 +92,19 @@ class __Settings(MutableMapping):
 sentinel = None
 
 
+def _file_mode(path: Path) -> int:
+    """
+    Return the permission bits of the file at path, or if there is none,
+    those a new file would be given.
+    """
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
 def Settings() -> __Settings:
     """Getter for __Settings singleton."""
     global sentinel
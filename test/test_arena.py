@@ -0,0 +1,107 @@
+import pickle
+import tracemalloc
+import unittest
+
+import convert
+from arena import PropositionArena, PropositionHandle
+from proposition import Atom, Negation, Conjunction, Disjunction, Universal
+
+
+class TestPropositionArena(unittest.TestCase):
+    strings = [
+        'A',
+        '~ A',
+        '(A & B) v ~ (A -> C)',
+        'forallx (P<x> -> existsy R<x, y>)',
+        'The cat is on the mat',
+    ]
+
+    def setUp(self) -> None:
+        self.arena = PropositionArena()
+        self.props = [convert.string_to_proposition(s) for s in self.strings]
+
+    def test_round_trip(self) -> None:
+        for prop in self.props:
+            with self.subTest(i=prop):
+                prop_id = self.arena.add(prop)
+                self.assertEqual(prop, self.arena.to_proposition(prop_id))
+
+    def test_equal_propositions_share_an_id(self) -> None:
+        first = self.arena.add(Conjunction(Atom('A'), Negation(Atom('A'))))
+        second = self.arena.add(Conjunction(Atom('A'), Negation(Atom('A'))))
+        self.assertEqual(first, second)
+        # A, ~ A and (A & ~ A)
+        self.assertEqual(3, len(self.arena))
+
+    def test_handle_matches_proposition(self) -> None:
+        for prop in self.props:
+            handle = self.arena.handle(self.arena.add(prop))
+            with self.subTest(i=prop):
+                self.assertEqual(str(prop), str(handle))
+                self.assertEqual(prop.long_string, handle.long_string)
+                self.assertEqual(prop.symb, handle.symb)
+                self.assertEqual(prop.arity, handle.arity)
+                self.assertEqual(prop.complexity, handle.complexity)
+                self.assertEqual(prop.names, handle.names)
+                self.assertEqual(prop.unbound_variables, handle.unbound_variables)
+                self.assertEqual(len(prop.content), len(handle.content))
+
+    def test_handle_content(self) -> None:
+        handle = self.arena.handle(self.arena.add(Conjunction(Atom('A'), Atom('B'))))
+        left, right = handle.content
+        self.assertIsInstance(left, PropositionHandle)
+        self.assertEqual(('A',), left.content)
+        self.assertEqual(('B',), right.content)
+
+    def test_instantiate(self) -> None:
+        prop = Universal('x', Conjunction(Atom('P<x>'), Atom('Q<bob>')))
+        handle = self.arena.handle(self.arena.add(prop))
+        for name in 'alice', 'bob':
+            with self.subTest(i=name):
+                instance = handle.instantiate('x', name)
+                self.assertEqual(prop.instantiate('x', name), instance.to_proposition())
+        ground = self.arena.handle(self.arena.add(Atom('Q<bob>')))
+        self.assertEqual(ground, ground.instantiate('x', 'alice'))
+
+    def test_pickle(self) -> None:
+        ids = [self.arena.add(prop) for prop in self.props]
+        loaded = pickle.loads(pickle.dumps(self.arena))
+        for prop_id, prop in zip(ids, self.props):
+            self.assertEqual(prop, loaded.to_proposition(prop_id))
+        self.assertEqual(ids[1], loaded.add(Negation(Atom('A'))))
+        for prop_id, prop in zip(ids, self.props):
+            self.assertEqual(prop.names, loaded.names(prop_id))
+            self.assertEqual(prop.unbound_variables, loaded.unbound_variables(prop_id))
+
+    def test_instances_know_their_names(self) -> None:
+        prop = Universal('x', Conjunction(Atom('P<x, y>'), Atom('Q<bob>')))
+        handle = self.arena.handle(self.arena.add(prop)).instantiate('x', 'alice')
+        expected = prop.instantiate('x', 'alice')
+        self.assertEqual(expected.names, handle.names)
+        self.assertEqual(expected.unbound_variables, handle.unbound_variables)
+
+    def test_rows_take_little_memory(self) -> None:
+        atoms = [Atom('P<alice, x>'), Atom('Q<bob>'), Atom('p'), Atom('q')]
+        props = []
+        for i in range(2000):
+            left = Conjunction(atoms[i % 4], Negation(Atom(f'R{i}')))
+            props.append(Universal('x', Disjunction(left, atoms[(i + 1) % 4])))
+        tracemalloc.start()
+        try:
+            for prop in props:
+                self.arena.add(prop)
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        # Atoms, R{i}, ~ R{i}, the conjunction, disjunction and universal.
+        rows = len(self.arena)
+        self.assertEqual(4 + 5 * 2000, rows)
+        # No names, alice, bob, and both.
+        self.assertEqual(4, len(self.arena.names_table))
+        # Six ints' worth of columns and two slots of the hash table
+        # per row, plus each new atom's string.
+        self.assertLess(size / rows, 80)
+
+
+if __name__ == '__main__':
+    unittest.main()
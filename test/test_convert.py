@@ -1,9 +1,11 @@
 import unittest
 
 import convert
+import proposition
 from tree import Tree, Branch
 
-from convert import find_connective, deparenthesize
+from convert import find_connective, deparenthesize, tokenize, \
+    PropositionParser, NotWellFormed
 from proposition import Atom, Conditional, Conjunction, \
     Disjunction, Negation, Universal, Existential
 from sequent import Sequent
@@ -179,6 +181,140 @@ class TestFindConnective(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestTokenize(unittest.TestCase):
+    def test_tokens(self) -> None:
+        expected = [
+            ('not', '~'), ('(', '('), ('quantifier', 'forallx'),
+            ('word', 'P<x,'), ('word', 'y>'), ('binary', 'implies'),
+            ('word', 'Q'), (')', ')')
+        ]
+        self.assertEqual(expected, tokenize('~ (forallx P<x, y> implies Q)'))
+
+    def test_parentheses_split_off_words(self) -> None:
+        expected = [('(', '('), ('(', '('), ('word', 'A'), (')', ')'), (')', ')')]
+        self.assertEqual(expected, tokenize('((A))'))
+
+    def test_parenthesis_inside_word_raises(self) -> None:
+        with self.assertRaises(NotWellFormed):
+            tokenize('f(x) & A')
+
+
+class TestPropositionParser(unittest.TestCase):
+    def test_connectives_group_right(self) -> None:
+        a, b, c = Atom('A'), Atom('B'), Atom('C')
+        expected = Conjunction(a, Disjunction(b, Conditional(a, c)))
+        self.assertEqual(expected, PropositionParser('A & B v A -> C').parse())
+
+    def test_prefixes_scope_over_the_rest(self) -> None:
+        expected = Conjunction(
+            Atom('A'),
+            Negation(Universal('x', Disjunction(Atom('P<x>'), Atom('B'))))
+        )
+        actual = PropositionParser('A & ~ forallx P<x> v B').parse()
+        self.assertEqual(expected, actual)
+
+    def test_parentheses(self) -> None:
+        expected = Conditional(
+            Conditional(Conditional(Atom('P'), Atom('Q')), Atom('P')),
+            Atom('P')
+        )
+        self.assertEqual(expected, PropositionParser('(((P -> Q) -> P) -> P)').parse())
+
+    def test_malformed_strings_raise(self) -> None:
+        for string in ('A &', '(A', 'A)', '~', '(A) B', 'A (B)'):
+            with self.subTest(i=string):
+                with self.assertRaises(NotWellFormed):
+                    PropositionParser(string).parse()
+
+    def test_malformed_strings_fall_back_to_splitting(self) -> None:
+        tests = {
+            'f(x) & A': Conjunction(Atom('f(x)'), Atom('A')),
+            'A &': Conjunction(Atom('A'), Atom('')),
+            'X (A v B)': Atom('X (A v B)'),
+        }
+        for string, expected in tests.items():
+            with self.subTest(i=string):
+                self.assertEqual(expected, convert.string_to_proposition(string))
+
+    def test_matches_splitting(self) -> None:
+        strings = [
+            '(A -> B) v (B -> A)',
+            '~ ~ (A & B) -> C',
+            'existsy forallx (R<x, y> and ~ S<y>) or T',
+            'the grass is green  and  the sky is blue',
+        ]
+        for string in strings:
+            with self.subTest(i=string):
+                self.assertEqual(
+                    convert.split_string_to_proposition(string),
+                    PropositionParser(string).parse()
+                )
+
+
+    def test_only_malformed_strings_are_split(self) -> None:
+        # The parser has no grammar for parentheses inside atoms, so the
+        # string is split, but its well-formed side is still parsed.
+        string = 'P(a) & ~ (B v C)'
+        with self.assertRaises(convert.NotWellFormed):
+            PropositionParser(string).parse()
+        expected = Conjunction(Atom('P(a)'), PropositionParser('~ (B v C)').parse())
+        self.assertEqual(expected, convert.string_to_proposition(string))
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        convert.proposition_cache.clear()
+        convert.sequent_cache.clear()
+
+    def test_repeated_propositions_are_parsed_once(self) -> None:
+        first = convert.string_to_proposition('(A & B) -> C')
+        second = convert.string_to_proposition('(A & B) -> C')
+        self.assertIs(first, second)
+        self.assertEqual(1, convert.proposition_cache.hits)
+        self.assertEqual(1, convert.proposition_cache.misses)
+
+    def test_only_whole_strings_are_cached(self) -> None:
+        convert.string_to_proposition('(A & B) -> (C v ~ (D))')
+        self.assertEqual(1, len(convert.proposition_cache))
+
+    def test_outer_parentheses_share_an_entry(self) -> None:
+        first = convert.string_to_proposition('A & B')
+        self.assertIs(first, convert.string_to_proposition('((A & B))'))
+        self.assertEqual(first, convert.string_to_proposition('(A & B) v C').left)
+        # A & B and (A & B) v C.
+        self.assertEqual(2, len(convert.proposition_cache))
+
+    def test_interning_empties_the_cache(self) -> None:
+        before = convert.string_to_proposition('A & B')
+        proposition.start_interning()
+        try:
+            after = convert.string_to_proposition('A & B')
+            self.assertIsNot(before, after)
+            self.assertIs(after, proposition.make(Conjunction, Atom('A'), Atom('B')))
+            self.assertIs(after, convert.string_to_sequent('A & B; C').ant[0])
+        finally:
+            proposition.stop_interning()
+        self.assertIsNot(after, convert.string_to_proposition('A & B'))
+
+    def test_sequents_are_keyed_on_their_propositions(self) -> None:
+        first = convert.string_to_sequent('A, B -> C; D')
+        second = convert.string_to_sequent(' A,B -> C ;D ')
+        self.assertIs(first, second)
+        self.assertEqual(1, convert.sequent_cache.hits)
+        self.assertIsNot(first, convert.string_to_sequent('B -> C, A; D'))
+
+    def test_cache_is_bounded(self) -> None:
+        cache = convert.ParseCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(1, cache.get('a'))
+        cache.put('c', 3)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual((2, 1), (cache.hits, cache.misses))
+
+
 class TestDeparenthesize(unittest.TestCase):
     def test_single_set(self) -> None:
         s = '(words)'
@@ -266,5 +402,36 @@ class TestConvertSequent(unittest.TestCase):
                 self.assertEqual(expected, actual)
 
 
+
+class TestIterSequents(unittest.TestCase):
+    lines = ['A; B', '', '# a comment', 'A, B', '~ C; D;', '  C ; D']
+
+    def test_blank_and_comment_lines_are_skipped(self) -> None:
+        actual = list(convert.iter_sequents(['A; B', '', '   ', '# A; B']))
+        self.assertEqual([Sequent((Atom('A'),), (Atom('B'),))], actual)
+
+    def test_errors_are_collected_with_line_numbers(self) -> None:
+        errors = []
+        actual = list(convert.iter_sequents(self.lines, errors))
+        expected = [
+            Sequent((Atom('A'),), (Atom('B'),)),
+            Sequent((Atom('C'),), (Atom('D'),))
+        ]
+        self.assertEqual(expected, actual)
+        self.assertEqual([4, 5], [line_number for line_number, _ in errors])
+
+    def test_errors_raise_without_a_list(self) -> None:
+        sequents = convert.iter_sequents(self.lines)
+        self.assertEqual(Sequent((Atom('A'),), (Atom('B'),)), next(sequents))
+        with self.assertRaisesRegex(ValueError, 'Line 4'):
+            next(sequents)
+
+    def test_lines_are_read_lazily(self) -> None:
+        lines = iter(['A; B', 'C; D'])
+        sequents = convert.iter_sequents(lines)
+        next(sequents)
+        self.assertEqual('C; D', next(lines))
+
+
 if __name__ == '__main__':
     unittest.main()
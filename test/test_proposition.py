@@ -1,7 +1,11 @@
+import pickle
+import tracemalloc
 import unittest
 
+import proposition
+
 from proposition import Atom, Negation, Conjunction, \
-    Conditional, Disjunction, Universal, Existential
+    Conditional, Disjunction, Universal, Existential, InternTable, make
 
 
 class TestProposition(unittest.TestCase):
@@ -16,6 +20,53 @@ class TestProposition(unittest.TestCase):
         atom = Atom('p1')
         self.assertEqual('p1', atom[0])
 
+    def test_metrics_are_stored_on_creation(self) -> None:
+        prop = Universal('x', Conjunction(Atom('P<x, y>'), Negation(Atom('Q<bob>'))))
+        self.assertEqual(3, prop._complexity)
+        self.assertEqual(frozenset({'bob'}), prop._names)
+        self.assertEqual(('y',), prop._unbound_variables)
+        self.assertEqual(prop._hash, hash(prop))
+
+    def test_hash_distinguishes_connectives(self) -> None:
+        p, q = Atom('p'), Atom('q')
+        self.assertNotEqual(hash(Conjunction(p, q)), hash(Disjunction(p, q)))
+
+    def test_metrics_are_shared_with_subpropositions(self) -> None:
+        p, q = Atom('p'), Atom('q')
+        self.assertIs(proposition.NO_NAMES, Conjunction(p, Negation(q)).names)
+        named = Atom('P<alice, x>')
+        prop = Conditional(named, Negation(Atom('Q<alice>')))
+        self.assertIs(named.names, prop.names)
+        self.assertIs(named.unbound_variables, prop.unbound_variables)
+        self.assertIs(named.unbound_variables, Universal('y', prop).unbound_variables)
+
+    def test_metrics_take_little_memory(self) -> None:
+        atoms = Atom('P<x>'), Atom('Q<y>'), Atom('p'), Atom('q')
+
+        def build(depth: int, index: int) -> proposition.Proposition:
+            if depth == 0:
+                return atoms[index % 4]
+            cls = (Conjunction, Disjunction, Conditional)[index % 3]
+            return cls(build(depth - 1, index + 1), build(depth - 1, index + 2))
+
+        tracemalloc.start()
+        try:
+            props = [build(6, i) for i in range(100)]
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        # 63 compound propositions each, which should hold little more
+        # than their fields once their names and variables are shared.
+        self.assertEqual(100, len(props))
+        self.assertLess(size / (100 * 63), 160)
+
+    def test_pickle_round_trip(self) -> None:
+        prop = Existential('x', Conditional(Atom('P<x>'), Negation(Atom('Q<amy>'))))
+        loaded = pickle.loads(pickle.dumps(prop))
+        self.assertEqual(prop, loaded)
+        self.assertEqual(hash(prop), hash(loaded))
+        self.assertEqual(prop.names, loaded.names)
+
 
 class TestAtom(unittest.TestCase):
     def setUp(self) -> None:
@@ -114,6 +165,22 @@ class TestAtom(unittest.TestCase):
             with self.subTest(i=t):
                 self.assertEqual(e, t.instantiate(v, n))
 
+    def test_atom_is_parsed_into_predicate_and_objects(self) -> None:
+        atom = Atom('Relation<diana, e, frieda>')
+        self.assertEqual('Relation', atom.predicate)
+        self.assertEqual(('diana', 'e', 'frieda'), atom.objects)
+        self.assertEqual(('p1', ()), (self.a1.predicate, self.a1.objects))
+
+    def test_atom_from_parts(self) -> None:
+        atom = Atom.from_parts('Relation', ('diana', 'e'))
+        expected = Atom('Relation<diana, e>')
+        self.assertEqual(expected, atom)
+        self.assertEqual(hash(expected), hash(atom))
+        self.assertEqual(expected.objects, atom.objects)
+        self.assertEqual(expected.predicate, atom.predicate)
+        self.assertEqual(expected.names, atom.names)
+        self.assertEqual(expected.unbound_variables, atom.unbound_variables)
+
 
 class TestNegation(unittest.TestCase):
     def setUp(self) -> None:
@@ -338,6 +405,49 @@ class TestQuantifiers(unittest.TestCase):
                 with self.subTest(i=a):
                     self.assertEqual(e, a.instantiate(v, n))        
 
+    def test_instantiate_shares_subpropositions_without_the_variable(self) -> None:
+        ground = Conjunction(Atom('Q<bob>'), Negation(Atom('R')))
+        for cls in self.classes:
+            q = cls('x', Disjunction(Atom('P<x>'), ground))
+            with self.subTest(i=cls):
+                result = q.instantiate_with('alice')
+                self.assertEqual(Disjunction(Atom('P<alice>'), ground), result)
+                self.assertIs(ground, result.right)
+
+    def test_instantiate_returns_self_when_variable_is_not_free(self) -> None:
+        tests = [
+            Atom('P<x, bob>'),
+            Negation(Atom('P<x>')),
+            Conjunction(Atom('P<x>'), Atom('Q')),
+            Universal('y', Atom('P<x, y>')),
+        ]
+        for t in tests:
+            with self.subTest(i=t):
+                self.assertIs(t, t.instantiate('z', 'zed'))
+        inner = Universal('y', Atom('P<y>'))
+        outer = Existential('y', Conjunction(Atom('Q<y>'), inner))
+        self.assertIs(inner, outer.instantiate_with('amy').right)
+
+    def test_instantiate_many(self) -> None:
+        names = ['alice', 'bob', 'carol']
+        props = [
+            Atom('P<x>'),
+            Atom('P<x, y, x>'),
+            Conditional(Atom('P<x, bob>'), Negation(Atom('Q<x>'))),
+            Conjunction(Atom('P<x>'), Universal('x', Atom('Q<x>'))),
+            Existential('y', Atom('R<x, y>')),
+            Atom('S<bob>'),
+        ]
+        for cls in self.classes:
+            for prop in props:
+                q = cls('x', prop)
+                with self.subTest(i=q):
+                    expected = tuple(q.instantiate_with(n) for n in names)
+                    self.assertEqual(expected, q.instantiate_many(names))
+        ground = Atom('S<bob>')
+        for instance in Universal('x', ground).instantiate_many(names):
+            self.assertIs(ground, instance)
+
 
 class TestBinary(unittest.TestCase):
     def setUp(self) -> None:
@@ -589,6 +699,71 @@ class TestBinary(unittest.TestCase):
                     self.assertEqual(e, t.instantiate(v, n))
                 
 
+class TestInterning(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = proposition.start_interning()
+
+    def tearDown(self) -> None:
+        proposition.stop_interning()
+
+    def test_make_without_interning_creates_new_objects(self) -> None:
+        proposition.stop_interning()
+        self.assertIsNot(make(Atom, 'P<x>'), make(Atom, 'P<x>'))
+
+    def test_equal_atoms_are_identical(self) -> None:
+        self.assertIs(make(Atom, 'P<x>'), make(Atom, 'P<x>'))
+        self.assertIsNot(make(Atom, 'P<x>'), make(Atom, 'P<y>'))
+
+    def test_equal_compound_propositions_are_identical(self) -> None:
+        first = make(Conjunction, Atom('p'), Negation(Atom('q')))
+        second = make(Conjunction, Atom('p'), Negation(Atom('q')))
+        self.assertIs(first, second)
+        self.assertIs(first.right, make(Negation, Atom('q')))
+        self.assertIsNot(first, make(Disjunction, Atom('p'), Negation(Atom('q'))))
+
+    def test_quantifiers_are_keyed_on_their_variable(self) -> None:
+        x = make(Universal, 'x', Atom('P<x, y>'))
+        y = make(Universal, 'y', Atom('P<x, y>'))
+        self.assertIs(x, make(Universal, 'x', Atom('P<x, y>')))
+        self.assertIsNot(x, y)
+        self.assertIsNot(x, make(Existential, 'x', Atom('P<x, y>')))
+
+    def test_intern_returns_equal_proposition(self) -> None:
+        prop = Conditional(Atom('p'), Atom('q'))
+        interned = self.table.intern(prop)
+        self.assertEqual(prop, interned)
+        self.assertIs(interned, self.table.intern(Conditional(Atom('p'), Atom('q'))))
+        self.assertIn(interned, self.table)
+        self.assertNotIn(prop, self.table)
+
+    def test_instantiation_is_interned(self) -> None:
+        uni = make(Universal, 'x', Conjunction(Atom('P<x>'), Atom('Q<bob>')))
+        self.assertIs(uni.instantiate_with('alice'), uni.instantiate_with('alice'))
+        self.assertIs(
+            make(Atom, 'P<alice>'),
+            uni.instantiate_with('alice').left
+        )
+
+    def test_invalid_content_still_raises(self) -> None:
+        with self.assertRaises(TypeError):
+            make(Negation, 'not a proposition')
+        with self.assertRaises(TypeError):
+            self.table.intern('not a proposition')
+
+    def test_atom_from_parts_is_interned(self) -> None:
+        atom = make(Atom, 'P<alice>')
+        self.assertIs(atom, Atom.from_parts('P', ('alice',)))
+        self.assertIs(Atom.from_parts('P', ('bob',)), make(Atom, 'P<bob>'))
+
+    def test_separate_table(self) -> None:
+        table = InternTable()
+        proposition.start_interning(table)
+        atom = make(Atom, 'p')
+        self.assertIs(proposition.intern_table, table)
+        self.assertEqual(1, len(table))
+        table.clear()
+        self.assertIsNot(atom, make(Atom, 'p'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from unittest.mock import patch
+
+import convert
+from prover import Prover
+from rules import RuleTable
+from proposition import Atom
+
+
+class TestProver(unittest.TestCase):
+    lines = ['∀x P<x>; P<alice>', '# comment', 'A, B', '', 'A & B; A']
+
+    def test_list_roots_share_names(self) -> None:
+        roots = [
+            convert.string_to_sequent('∀x P<x>; P<alice>'),
+            convert.string_to_sequent('∀x P<x>; P<bob>')
+        ]
+        prover = Prover(roots)
+        prover.run()
+        self.assertEqual({'alice', 'bob'}, prover.names)
+        self.assertEqual(2, len(prover.forest[0].branches))
+
+    def test_lazy_roots_use_their_own_names(self) -> None:
+        prover = Prover(convert.iter_sequents(['∀x P<x>; P<alice>', '∀x P<x>; P<bob>']))
+        self.assertEqual([], prover.roots)
+        prover.run()
+        self.assertEqual(2, len(prover.roots))
+        for tree in prover.forest:
+            with self.subTest(i=str(tree.root)):
+                self.assertEqual(1, len(tree.branches))
+
+    def test_lazy_roots_add_their_names(self) -> None:
+        prover = Prover(convert.iter_sequents(['∀x P<x>; P<alice>', '∀x P<x>; P<bob>']))
+        prover.run()
+        self.assertEqual({'alice', 'bob'}, prover.export()['names'])
+
+    def test_listed_lines_share_names(self) -> None:
+        prover = Prover.from_lines(['∀x P<x>;', '# P<carol>', 'P<amy>; Q'])
+        prover.run()
+        self.assertEqual({'amy'}, prover.names)
+        tree = prover.forest[0]
+        parent, = tree.parents
+        self.assertEqual(convert.string_to_sequent('P<amy>;'), parent.root)
+        prover = Prover.from_lines(['∀x P<x>;', 'A; B'])
+        self.assertEqual({'NONE'}, prover.names)
+
+    def test_from_lines_collects_errors(self) -> None:
+        prover = Prover.from_lines(self.lines)
+        prover.run()
+        self.assertEqual(2, len(prover.forest))
+        self.assertEqual([3], [line_number for line_number, _ in prover.errors])
+
+    def test_from_lines_in_parallel(self) -> None:
+        lines = [f'P<n{i}>; A & P<n{i}>' for i in range(12)] + ['A; B; C']
+        prover = Prover.from_lines(lines)
+        prover.run()
+        expected = [Atom(f'P<n{i}>') for i in range(12)]
+        self.assertEqual(expected, [root.ant[0] for root in prover.roots])
+        self.assertEqual(12, len(prover.forest))
+        self.assertEqual([13], [line_number for line_number, _ in prover.errors])
+
+    def test_memoized_roots_share_trees(self) -> None:
+        prover = Prover.from_lines(['A & B; A', 'C; D', 'A & B; A'], memoize=True)
+        prover.run()
+        self.assertIs(prover.forest[0], prover.forest[2])
+        prover = Prover.from_lines(['A & B; A', 'A & B; A'])
+        prover.run()
+        self.assertIsNot(prover.forest[0], prover.forest[1])
+
+    def test_check_mode(self) -> None:
+        prover = Prover.from_lines(['A & B; A', 'A; B', 'A;; B', 'A; B'], check=True,
+                                   base=[convert.string_to_sequent('A; B')])
+        prover.run()
+        self.assertEqual([True, True, True], prover.results)
+        self.assertEqual([], prover.forest)
+        self.assertEqual([3], [line_number for line_number, _ in prover.errors])
+        prover = Prover([convert.string_to_sequent('A; B')], check=True)
+        prover.run()
+        self.assertEqual([False], prover.export()['results'])
+
+    def test_pruning_cannot_use_a_base(self) -> None:
+        with self.assertRaises(ValueError):
+            Prover.from_lines(['A, C; B & C'], check=True, prune=True,
+                              base=[convert.string_to_sequent('A; B')])
+
+    def test_rules_are_passed_in(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            table = RuleTable.from_settings()
+        prover = Prover.from_lines([f'A & B; C{i}' for i in range(12)], rules=table)
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            prover.run()
+        self.assertEqual([2] * 12, [len(tree.branches) for tree in prover.forest])
+
+
+if __name__ == '__main__':
+    unittest.main()
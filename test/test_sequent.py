@@ -1,3 +1,6 @@
+import dataclasses
+import pickle
+import random
 import unittest
 
 from sequent import Sequent
@@ -74,6 +77,12 @@ class TestSequent(unittest.TestCase):
         actual = s_1.first_complex_prop()
         self.assertEqual(expected, actual)
 
+    def test_complex_props(self) -> None:
+        s = Sequent((self.p, self.n), (self.q, self.cj, self.dj))
+        expected = [(self.n, 'ant', 1), (self.cj, 'con', 1), (self.dj, 'con', 2)]
+        self.assertEqual(expected, list(s.complex_props()))
+        self.assertEqual([], list(Sequent((self.p,), (self.q,)).complex_props()))
+
     def test_atomic_first_complex_prop(self) -> None:
         s = Sequent((self.p,), (self.q,))
         expected = None
@@ -112,6 +121,43 @@ class TestSequent(unittest.TestCase):
         self.assertEqual(expected, s_1.possible_mix_parents())
 
 
+    def test_iter_mix_parents(self) -> None:
+        s = Sequent((self.p, self.q), (self.cj, self.cd, self.n))
+        expected = s.possible_mix_parents()
+        self.assertEqual(32, s.count_mix_parents())
+        self.assertEqual(expected[:5], list(s.iter_mix_parents(limit=5)))
+        self.assertEqual(expected[:16], list(s.iter_mix_parents(unordered=True)))
+        self.assertEqual([], list(s.iter_mix_parents(limit=0)))
+
+    def test_iter_mix_splits(self) -> None:
+        s = Sequent((self.p, self.n), (self.cj, self.dj, self.cd))
+        expected = [
+            (Sequent(*first), Sequent(*second)) for first, second in s.iter_mix_splits()
+        ]
+        self.assertEqual(s.possible_mix_parents(), expected)
+
+    def test_mix_parents_at(self) -> None:
+        s = Sequent((self.p, self.q), (self.cj, self.cd, self.n))
+        expected = s.possible_mix_parents()
+        actual = [s.mix_parents_at(i) for i in range(s.count_mix_parents())]
+        self.assertEqual(expected, actual)
+        with self.assertRaises(IndexError):
+            s.mix_parents_at(32)
+
+    def test_sample_mix_parents(self) -> None:
+        s = Sequent((self.p, self.q), (self.cj, self.cd, self.n))
+        sample = s.sample_mix_parents(6, random.Random(0))
+        self.assertEqual(6, len(set(sample)))
+        self.assertTrue(set(sample) <= set(s.possible_mix_parents()))
+        self.assertEqual(32, len(s.sample_mix_parents(100)))
+
+    def test_sample_mix_parents_of_large_sequents(self) -> None:
+        s = Sequent(tuple(Atom(f'p{i}') for i in range(64)), ())
+        sample = s.sample_mix_parents(3, random.Random(0))
+        self.assertEqual(3, len(set(sample)))
+        for left, right in sample:
+            self.assertEqual(64, len(left.ant) + len(right.ant))
+
     def test_is_atomic(self) -> None:
         a = Sequent((self.p,), (self.q,))
         self.assertTrue(a.is_atomic)
@@ -161,6 +207,42 @@ class TestSequent(unittest.TestCase):
         for s, e in zip(sequents, expected):
             self.assertEqual(e, s.tag())
 
+    def test_mix(self) -> None:
+        s_0 = Sequent((self.p,), (self.q,))
+        s_1 = Sequent((self.n,), ())
+        s_2 = Sequent((), (self.cj, self.dj))
+        expected = Sequent((self.p, self.n), (self.q, self.cj, self.dj))
+        self.assertEqual(expected, Sequent.mix(s_0, s_1, s_2))
+        self.assertEqual(expected, s_0.mix(s_1, s_2))
+
+    def test_extend_and_prepend(self) -> None:
+        s = Sequent((self.p,), (self.q,))
+        self.assertEqual(
+            Sequent((self.p, self.n), (self.q, self.cj)),
+            s.extend(ant=(self.n,), con=(self.cj,))
+        )
+        self.assertEqual(Sequent((self.p,), (self.cj, self.q)), s.prepend(con=(self.cj,)))
+        self.assertEqual(s.mix(Sequent((self.n,), ())), s.extend(ant=(self.n,)))
+        self.assertEqual(Sequent((), (self.cj,)).mix(s), s.prepend(con=(self.cj,)))
+
+    def test_sequent_is_immutable(self) -> None:
+        s = Sequent((self.p,), (self.q,))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            s.ant = (self.q,)
+
+    def test_sequent_hash_is_cached(self) -> None:
+        s = Sequent((self.cj,), (self.dj, self.n))
+        self.assertEqual(hash((self.cj, '|-', self.dj, self.n)), hash(s))
+        self.assertEqual(hash(s), hash(Sequent((self.cj,), (self.dj, self.n))))
+        self.assertNotEqual(hash(s), hash(Sequent((self.cj, self.dj), (self.n,))))
+
+    def test_sequent_pickles(self) -> None:
+        s = Sequent((self.cj,), (self.dj, self.n))
+        loaded = pickle.loads(pickle.dumps(s))
+        self.assertEqual(s, loaded)
+        self.assertEqual(hash(s), hash(loaded))
+        self.assertEqual(s.first_complex_prop(), loaded.first_complex_prop())
+
 
 if __name__ == '__main__':
     unittest.main()
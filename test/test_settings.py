@@ -1,4 +1,5 @@
 import json
+import os
 import unittest
 
 from unittest.mock import patch
@@ -46,6 +47,20 @@ class TestSettings(unittest.TestCase):
     def test_load_settings(self) -> None:
         self.assertEqual(test_config, self.s.dict)
 
+    def test_loading_does_not_write(self) -> None:
+        with patch('settings.CONFIG_PATH', test_config_path), \
+                patch('settings.__Settings.save', side_effect=AssertionError):
+            settings_singleton()
+
+    def test_saving_keeps_permissions(self) -> None:
+        mode = os.stat(test_config_path).st_mode & 0o777
+        try:
+            os.chmod(test_config_path, 0o644)
+            self.s.set_rule('&', 'ant', 'add')
+            self.assertEqual(0o644, os.stat(test_config_path).st_mode & 0o777)
+        finally:
+            os.chmod(test_config_path, mode)
+
     def test_update(self) -> None:
         pos = {'positivists': 
             ['Carnap', 'Hahn', 'Neurath', 'Schlick']
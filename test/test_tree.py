@@ -1,9 +1,13 @@
+import pickle
+import random
 import unittest
 
 from unittest.mock import patch
 
 import convert
-from tree import Tree
+from proposition import Atom, Conjunction
+from sequent import Sequent
+from tree import Tree, LazyBranches, in_base
 
 
 class TestTreeMethods(unittest.TestCase):
@@ -47,6 +51,75 @@ class TestTreeMethods(unittest.TestCase):
             one_parent = convert.string_to_tree('A & B; C')
             self.assertEqual(1, one_parent.width())
 
+    def test_tree_sequents(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A v B; C & D', grow=False)
+            expected = [
+                convert.string_to_sequent(s) for s in ('A; C', 'A; D', 'B; C', 'B; D')
+            ]
+            self.assertEqual(expected, list(tree.sequents()))
+
+    def test_tree_sequents_by_branch(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A & B; C', grow=False)
+            expected = [
+                ((0,), convert.string_to_sequent('A; C')),
+                ((1,), convert.string_to_sequent('B; C'))
+            ]
+            self.assertEqual(expected, list(tree.sequents(by_branch=True)))
+
+    def test_tree_sequents_grow_on_demand(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A v B; C & D', grow=False)
+            sequents = tree.sequents()
+            self.assertEqual(convert.string_to_sequent('A; C'), next(sequents))
+            self.assertFalse(tree.branches[0][1].is_grown)
+
+    def test_deep_trees_do_not_recurse(self) -> None:
+        prop = Atom('A')
+        for i in range(1500):
+            prop = Conjunction(Atom(f'A{i}'), prop)
+        tree = Tree(Sequent(ant=prop, con=None))
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            self.assertEqual(1501, tree.height())
+            self.assertEqual(1, tree.width())
+            self.assertEqual(1, len(tree.split()))
+
+    def test_tree_counts(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A v B; C & D', grow=False)
+            self.assertEqual(7, tree.node_count())
+            self.assertEqual(4, tree.leaf_count())
+            self.assertEqual(1, tree.branches[0][0].branches[0][1].node_count())
+
+    def test_measurements_are_kept(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A v B; C & D')
+            self.assertEqual(3, tree.height())
+        with patch.object(Tree, '_post_order') as walk:
+            self.assertEqual(3, tree.height())
+            self.assertEqual(4, tree.width())
+            self.assertEqual(2, tree.branches[0][0].width())
+            walk.assert_not_called()
+
+
+class TestGrowAll(unittest.TestCase):
+    def test_grow_all_grows_every_tree(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            for order in 'depth', 'breadth':
+                with self.subTest(i=order):
+                    tree = convert.string_to_tree('A v B; C & D', grow=False)
+                    counts = tree.grow_all(order)
+                    self.assertEqual(7, counts['nodes'])
+                    self.assertEqual(7, counts['grown'])
+                    self.assertEqual(4, counts['leaves'])
+                    self.assertTrue(all(t.is_grown for t in tree.branches[0]))
+                    self.assertEqual(0, tree.grow_all(order)['grown'])
+
+    def test_grow_all_order(self) -> None:
+        with self.assertRaises(ValueError):
+            convert.string_to_tree('A; B', grow=False).grow_all('sideways')
+
 
 class TestTreeSplitting(unittest.TestCase):
     def test_atomic_tree_is_no_op(self) -> None:
@@ -266,5 +339,133 @@ class TestTreeSplitting(unittest.TestCase):
 
 
 
+class TestProvability(unittest.TestCase):
+    def test_is_provable(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            for string, expected in (('A; A', True), ('A; B', False),
+                                     ('A & B; A', True), ('A v B; A', False),
+                                     ('A v B; A, B', True), ('A, B; A & B', True)):
+                with self.subTest(i=string):
+                    tree = convert.string_to_tree(string, grow=False)
+                    self.assertEqual(expected, tree.is_provable())
+
+    def test_search_stops_early(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            # The first branch (A; A) closes, so B & C; A is never grown.
+            tree = convert.string_to_tree('A & (B & C); A', grow=False)
+            self.assertTrue(tree.is_provable())
+            self.assertFalse(tree.branches[1][0].is_grown)
+            # D; B fails, so D; C is never grown.
+            tree = convert.string_to_tree('D; B & C', grow=False)
+            self.assertFalse(tree.is_provable())
+            self.assertFalse(tree.branches[0][1].is_grown)
+
+    def test_atomic_base(self) -> None:
+        base = [convert.string_to_sequent('A; B')]
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = convert.string_to_tree('A; B & A', grow=False)
+            self.assertFalse(tree.is_provable())
+            self.assertTrue(tree.is_provable(in_base(base)))
+
+    def test_pruned_trees_only_search_for_identities(self) -> None:
+        base = [convert.string_to_sequent('A; B')]
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = Tree(convert.string_to_sequent('A, C; B & C'), prune=True)
+            self.assertFalse(tree.is_provable())
+            with self.assertRaises(ValueError):
+                tree.is_provable(in_base(base))
+
+
+class TestLazySplitting(unittest.TestCase):
+    def test_count_splits(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            for string, count in ('A; B', 1), ('A & B; C v D', 4), ('A v B; C & D', 1):
+                with self.subTest(i=string):
+                    tree = convert.string_to_tree(string)
+                    self.assertEqual(count, tree.count_splits())
+                    self.assertEqual(count, len(tree.split()))
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = convert.string_to_tree('A v B; C & D')
+            self.assertEqual(len(tree.split()), tree.count_splits())
+
+    def test_iter_splits_matches_split(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = convert.string_to_tree('A v B, E; C & D')
+            expected = tree.split()
+            self.assertEqual(expected, list(tree.iter_splits()))
+            self.assertEqual(expected[:3], list(tree.iter_splits(limit=3)))
+            self.assertEqual(expected[-1], tree.split_at(len(expected) - 1))
+            with self.assertRaises(IndexError):
+                tree.split_at(len(expected))
+
+    def test_sample_splits(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = convert.string_to_tree('A v B, E; C & D')
+            expected = tree.split()
+            sample = tree.sample_splits(5, random.Random(0))
+            self.assertEqual(5, len(sample))
+            self.assertEqual(sample, [s for s in expected if s in sample])
+            self.assertEqual(expected, tree.sample_splits(len(expected) + 1))
+
+
+class TestLazyBranches(unittest.TestCase):
+    def setUp(self) -> None:
+        # Right multiplicative conjunction: a branch for each of the 16
+        # splits of p, q, r, s.
+        self.sequent = convert.string_to_sequent('p, q, r, s; p & q')
+
+    def tree(self, prune: bool = False) -> Tree:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = Tree(self.sequent, prune=prune)
+            tree.grow(lazy=True)
+        return tree
+
+    def test_branches_are_made_as_reached(self) -> None:
+        tree = self.tree()
+        self.assertIsInstance(tree.branches, LazyBranches)
+        self.assertTrue(tree.is_grown)
+        self.assertEqual([], tree.branches.made)
+        tree.branches[2]
+        self.assertEqual(3, len(tree.branches.made))
+        self.assertFalse(tree.branches.is_complete)
+        self.assertEqual(16, len(tree.branches))
+        self.assertTrue(tree.branches.is_complete)
+
+    def test_same_branches_as_eager(self) -> None:
+        lazy = self.tree()
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            eager = Tree(self.sequent)
+            eager.grow()
+        self.assertIsInstance(eager.branches, tuple)
+        self.assertEqual(eager.branches, lazy.branches)
+        self.assertEqual(lazy.branches, eager.branches)
+        self.assertEqual(eager.node_count(), lazy.node_count())
+
+    def test_pruned_once_complete(self) -> None:
+        tree = self.tree(prune=True)
+        next(iter(tree.branches))
+        self.assertEqual(0, tree.pruned)
+        self.assertEqual(4, len(tree.branches))
+        self.assertEqual(12, tree.pruned)
+
+    def test_pickles_as_tuple(self) -> None:
+        tree = self.tree()
+        loaded = pickle.loads(pickle.dumps(tree))
+        self.assertIsInstance(loaded.branches, tuple)
+        self.assertEqual(16, len(loaded.branches))
+
+    def test_one_branch_rules_are_not_lazy(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = convert.string_to_tree('p & q; p', grow=False)
+            tree.grow(lazy=True)
+        self.assertIsInstance(tree.branches, tuple)
+
+    def test_search_makes_few_branches(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree = Tree(self.sequent)
+            self.assertTrue(tree.is_provable())
+        self.assertLess(len(tree.branches.made), 16)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,13 @@
+import itertools
+import pickle
 import unittest
 from unittest.mock import patch
 
+import convert
 from proposition import Atom, Conjunction, Disjunction, Conditional, Negation, Universal, Existential
 from sequent import Sequent
-from tree import Tree, Branch
+from rules import RuleTable, LeftMultIf, RightMultOr, RightNot, LeftMultAnd, branching, get_rule, is_invertible_step
+from tree import Tree, TreeMemo, Branch
 
 
 class TestAtomic(unittest.TestCase):
@@ -845,3 +849,372 @@ class TestTwoParentNonInvertible(unittest.TestCase):
         self.assertEqual(l3, tree.branches[3][0].root)
         self.assertIsInstance(tree.branches[3][1], Tree)
         self.assertEqual(r3, tree.branches[3][1].root)
+
+
+class TestPruning(unittest.TestCase):
+    def test_right_mul_and_prunes_unclosable_splits(self):
+        p, q, r = (Atom(c) for c in 'pqr')
+        sequent = Sequent(ant=(p, q), con=(Conjunction(p, q), r))
+        tree = Tree(sequent, prune=True)
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+
+        expected = (
+            Branch((Tree(Sequent((p,), (p, r))), Tree(Sequent((q,), (q,))))),
+            Branch((Tree(Sequent((p,), (p,))), Tree(Sequent((q,), (q, r))))),
+        )
+        self.assertEqual(expected, tree.branches)
+        self.assertEqual(6, tree.pruned)
+        self.assertTrue(all(parent.prune for parent in tree.parents))
+
+    def test_pruning_keeps_provability(self):
+        strings = [
+            'r, p; (r -> q) & p',
+            'p, q; ~ (p -> ~ q) & (q v r)',
+            'p -> q, r; (q & r) v p',
+            'p v q, ~ r; (p & ~ r) v (q -> r)',
+            'p, (q -> r) -> p; (p & q) -> r, p',
+        ]
+        sequents = [convert.string_to_sequent(string) for string in strings]
+        settings = [(side, connective) for side in ('ant', 'con') for connective in ('&', 'v', '->')]
+        for rule_types in itertools.product(('add', 'mul'), repeat=len(settings)):
+            table = RuleTable.from_settings()
+            for (side, connective), rule_type in zip(settings, rule_types):
+                table = table.override(side, connective, rule_type)
+            for sequent in sequents:
+                with self.subTest(i=(rule_types, str(sequent))):
+                    self.assertEqual(
+                        Tree(sequent, rule_table=table).is_provable(),
+                        Tree(sequent, rule_table=table, prune=True).is_provable()
+                    )
+
+    def test_pruning_matches_predicates(self):
+        p, q = Atom('P<alice>'), Atom('Q<bob>')
+        sequent = Sequent(ant=(q, p), con=Conjunction(Universal('x', Atom('P<x>')), q))
+        tree = Tree(sequent, prune=True)
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+        left_parent = Sequent((p,), (Universal('x', Atom('P<x>')),))
+        right_parent = Sequent((q,), (q,))
+        self.assertEqual(1, len(tree.branches))
+        self.assertEqual((left_parent, right_parent), tuple(t.root for t in tree.branches[0]))
+        self.assertEqual(3, tree.pruned)
+
+    def test_pruning_respects_polarity(self):
+        p, q = Atom('p'), Atom('q')
+        sequent = Sequent(ant=(q, p), con=Conjunction(p, Negation(q)))
+        tree = Tree(sequent, prune=True)
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+        # ~ q can't close against q in the antecedent, so every split is
+        # pruned and only the first is kept.
+        self.assertEqual(1, len(tree.branches))
+        self.assertEqual(3, tree.pruned)
+
+    def test_one_split_is_always_kept(self):
+        p, q = Atom('p'), Atom('q')
+        tree = Tree(Sequent(ant=q, con=Conjunction(p, p)), prune=True)
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+            self.assertEqual(1, len(tree.branches))
+            self.assertEqual(1, tree.pruned)
+            self.assertEqual(1, tree.total_pruned())
+
+    def test_no_pruning_by_default(self):
+        p, q, r = (Atom(c) for c in 'pqr')
+        tree = Tree(Sequent(ant=(p, q), con=(Conjunction(p, q), r)))
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+        self.assertEqual(8, len(tree.branches))
+        self.assertEqual(0, tree.pruned)
+
+
+class TestTreeMemo(unittest.TestCase):
+    def test_identical_parents_are_shared(self):
+        p, q = Atom('p'), Atom('q')
+        memo = TreeMemo()
+        sequent = Sequent(ant=None, con=Conjunction(Conjunction(p, q), Conjunction(p, q)))
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            tree = memo.tree(sequent)
+            tree.grow()
+        left, right = tree.branches[0]
+        self.assertIs(left, right)
+        self.assertEqual(1, memo.hits)
+        self.assertIs(tree, memo.tree(sequent))
+
+    def test_memo_keys_on_names_and_rules(self):
+        p = Atom('p')
+        sequent = Sequent(ant=Universal('x', Atom('P<x>')), con=p)
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            memo = TreeMemo()
+            self.assertIs(memo.tree(sequent), memo.tree(sequent))
+            self.assertIsNot(memo.tree(sequent), memo.tree(sequent, {'alice'}))
+            self.assertIsNot(memo.tree(sequent), memo.tree(sequent, prune=True))
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            self.assertNotEqual(memo.rule_table, TreeMemo().rule_table)
+
+    def test_trees_pickle_without_their_memo(self):
+        memo = TreeMemo()
+        tree = memo.tree(Sequent(ant=Atom('p'), con=Atom('p')))
+        loaded = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(tree, loaded)
+        self.assertIsNone(loaded.memo)
+
+
+class TestRuleTable(unittest.TestCase):
+    def table(self, rule_type: str) -> RuleTable:
+        with patch('settings.__Settings.get_rule', return_value=rule_type):
+            return RuleTable.from_settings()
+
+    def test_table_is_used_instead_of_settings(self):
+        p, q = Atom('p'), Atom('q')
+        tree = Tree(Sequent(ant=Conjunction(p, q), con=Conjunction(p, q)), rule_table=self.table('add'))
+        with patch('settings.__Settings.get_rule', side_effect=AssertionError):
+            tree.grow_all()
+        # Left additive conjunction: a branch for each conjunct, each of
+        # which splits into two parents by right additive conjunction.
+        self.assertEqual(2, len(tree.branches))
+        self.assertEqual(2, len(tree.branches[0][0].branches[0]))
+        self.assertTrue(all(parent.rule_table is tree.rule_table for parent in tree.parents))
+
+    def test_trees_take_a_table_from_settings_when_grown(self):
+        tree = Tree(Sequent(ant=Conjunction(Atom('p'), Atom('q')), con=None))
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            tree.grow()
+        self.assertEqual(self.table('mul'), tree.rule_table)
+        self.assertEqual(1, len(tree.branches))
+
+    def test_tables_pickle_by_value(self):
+        table = self.table('mul')
+        loaded = pickle.loads(pickle.dumps(table))
+        self.assertEqual(table, loaded)
+        self.assertEqual(hash(table), hash(loaded))
+        self.assertEqual(table.rules.keys(), loaded.rules.keys())
+        self.assertNotEqual(table, self.table('add'))
+
+    def test_override_replaces_one_rule(self):
+        table = self.table('mul')
+        with patch('settings.__Settings.set_rule', side_effect=AssertionError), \
+                patch('settings.__Settings.save', side_effect=AssertionError):
+            overridden = table.override('ant', '&', 'add')
+        before = {(s, c): t for s, c, t in table.types}
+        after = {(s, c): t for s, c, t in overridden.types}
+        self.assertEqual('mul', before.pop(('ant', '&')))
+        self.assertEqual('add', after.pop(('ant', '&')))
+        self.assertEqual(before, after)
+        with self.assertRaises(ValueError):
+            table.override('ant', '&', 'both')
+
+
+class TestSelectionStrategies(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            self.table = RuleTable.from_settings()
+        p, q = Atom('p'), Atom('q')
+        # Left multiplicative conditional (two branches) before right
+        # multiplicative disjunction (invertible, one branch).
+        self.sequent = Sequent(ant=Conditional(p, q), con=Disjunction(p, q))
+
+    def rule(self, strategy: str, sequent: Sequent = None):
+        return self.table.with_strategy(strategy).rule_for(sequent or self.sequent)
+
+    def test_leftmost_is_default(self) -> None:
+        self.assertEqual('leftmost', self.table.strategy)
+        self.assertIsInstance(self.rule('leftmost'), LeftMultIf)
+
+    def test_invertible_first(self) -> None:
+        rule = self.rule('invertible')
+        self.assertIsInstance(rule, RightMultOr)
+        self.assertEqual(Sequent(ant=Conditional(Atom('p'), Atom('q')), con=None), rule.sequent)
+
+    def test_invertible_first_skips_branching_rules(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='add'):
+            table = RuleTable.from_settings(strategy='invertible')
+        sequent = Sequent(ant=None, con=(Disjunction(Atom('p'), Atom('q')), Negation(Atom('r'))))
+        self.assertIsInstance(table.rule_for(sequent), RightNot)
+
+    def test_fewest_branches_first(self) -> None:
+        self.assertIsInstance(self.rule('fewest-branches'), RightMultOr)
+
+    def test_smallest_first(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        sequent = Sequent(ant=Conjunction(Conjunction(p, q), r), con=Negation(p))
+        self.assertIsInstance(self.rule('smallest', sequent), RightNot)
+        # Ties go to the leftmost proposition.
+        self.assertIsInstance(self.rule('smallest'), LeftMultIf)
+        self.assertIsInstance(self.rule('leftmost', sequent), LeftMultAnd)
+
+    def test_branching(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        sequent = Sequent(ant=(Conditional(p, q), p, q), con=r)
+        rule = self.table.rule_for(sequent)
+        self.assertEqual(8, branching(rule))
+        self.assertEqual(len(rule.apply()), branching(rule))
+        self.assertEqual(1, branching(self.rule('invertible')))
+        forall = Sequent(ant=Universal('x', Atom('P<x>')), con=None)
+        rule = self.table.rule_for(forall, names={'alice', 'bob'})
+        self.assertEqual(2, branching(rule))
+        self.assertEqual(len(rule.apply()), branching(rule))
+
+    def test_get_rule_strategy(self) -> None:
+        rule = get_rule(self.sequent, table=self.table, strategy='invertible')
+        self.assertIsInstance(rule, RightMultOr)
+
+    def test_unknown_strategy(self) -> None:
+        with self.assertRaises(ValueError):
+            self.table.with_strategy('rightmost')
+
+    def test_strategy_is_part_of_table(self) -> None:
+        table = self.table.with_strategy('fewest-branches')
+        self.assertNotEqual(self.table, table)
+        self.assertEqual(table, pickle.loads(pickle.dumps(table)))
+        self.assertEqual('fewest-branches', table.override('ant', '&', 'add').strategy)
+
+    def test_trees_use_strategy(self) -> None:
+        p, q = Atom('p'), Atom('q')
+        sequent = Sequent(ant=Conjunction(p, q), con=Conjunction(q, p))
+        for strategy in ('leftmost', 'invertible', 'fewest-branches', 'smallest'):
+            with self.subTest(i=strategy):
+                tree = Tree(self.sequent, rule_table=self.table.with_strategy(strategy))
+                tree.grow()
+                expected = 2 if strategy in ('leftmost', 'smallest') else 1
+                self.assertEqual(expected, len(tree.branches))
+                self.assertTrue(Tree(sequent, rule_table=self.table.with_strategy(strategy)).is_provable())
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self) -> None:
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            self.table = RuleTable.from_settings()
+        p, q = Atom('p'), Atom('q')
+        # Nothing but invertible one-parent rules, down to p, q; q v p.
+        self.sequent = Sequent(
+            ant=Negation(Negation(Conjunction(p, q))),
+            con=Negation(Negation(Disjunction(q, p)))
+        )
+
+    def test_is_invertible_step(self) -> None:
+        p, q = Atom('p'), Atom('q')
+        self.assertTrue(is_invertible_step(self.table.rule_for(self.sequent)))
+        self.assertFalse(is_invertible_step(self.table.rule_for(Sequent(ant=Conditional(p, q), con=None))))
+        table = self.table.override('con', 'v', 'add')
+        self.assertFalse(is_invertible_step(table.rule_for(Sequent(ant=None, con=Disjunction(p, q)))))
+
+    def test_runs_are_one_step(self) -> None:
+        tree = Tree(self.sequent, rule_table=self.table.with_compression())
+        tree.grow()
+        expected = 'LeftNot', 'RightNot', 'LeftNot', 'RightNot', 'LeftMultAnd', 'RightMultOr'
+        self.assertEqual(expected, tree.steps)
+        parent, = tree.parents
+        self.assertEqual(Sequent(ant=(Atom('p'), Atom('q')), con=(Atom('q'), Atom('p'))), parent.root)
+        self.assertEqual(2, tree.node_count())
+        self.assertEqual(7, Tree(self.sequent, rule_table=self.table).node_count())
+
+    def test_runs_stop_at_other_rules(self) -> None:
+        p, q = Atom('p'), Atom('q')
+        sequent = Sequent(ant=Negation(Negation(Conditional(p, q))), con=None)
+        tree = Tree(sequent, rule_table=self.table.with_compression())
+        tree.grow()
+        self.assertEqual(('LeftNot', 'RightNot'), tree.steps)
+        parent, = tree.parents
+        parent.grow()
+        self.assertEqual((), parent.steps)
+        self.assertEqual(2, len(parent.branches[0]))
+
+    def test_chain(self) -> None:
+        tree = Tree(self.sequent, rule_table=self.table.with_compression())
+        tree.grow()
+        chain = tree.chain()
+        self.assertEqual(len(tree.steps), len(chain))
+        self.assertEqual(self.sequent, chain[0])
+        # Each sequent in the chain is the only parent of the one before.
+        expected, current = [], Tree(self.sequent, rule_table=self.table)
+        for _ in chain:
+            expected.append(current.root)
+            current.grow()
+            current, = current.parents
+        self.assertEqual(expected, chain)
+        parent, = tree.parents
+        self.assertEqual(current.root, parent.root)
+
+    def test_expand(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        sequent = Sequent(ant=(Conjunction(p, Conjunction(q, r)), Negation(r)),
+                          con=Conditional(p, Disjunction(q, r)))
+        compressed = Tree(sequent, rule_table=self.table.with_compression())
+        uncompressed = Tree(sequent, rule_table=self.table)
+        uncompressed.grow_all()
+        self.assertLess(compressed.node_count(), uncompressed.node_count())
+        self.assertEqual(uncompressed, compressed.expand())
+        self.assertEqual(uncompressed.node_count(), compressed.expand().node_count())
+        self.assertEqual(list(uncompressed.sequents()), list(compressed.sequents()))
+        self.assertEqual(uncompressed.is_provable(), compressed.is_provable())
+
+    def test_expand_quantified(self) -> None:
+        sequent = convert.string_to_sequent('; (~ C v P<x>), ~ ∀x P<x>')
+        for names in set(), {'alice'}:
+            compressed = Tree(sequent, names=set(names), rule_table=self.table.with_compression())
+            uncompressed = Tree(sequent, names=set(names), rule_table=self.table)
+            uncompressed.grow_all()
+            with self.subTest(i=names):
+                self.assertEqual(uncompressed, compressed.expand())
+                self.assertEqual(names, compressed.names)
+
+    def test_compression_is_part_of_table(self) -> None:
+        table = self.table.with_compression()
+        self.assertNotEqual(self.table, table)
+        self.assertEqual(table, pickle.loads(pickle.dumps(table)))
+        memo = TreeMemo(rule_table=table)
+        tree = memo.tree(self.sequent)
+        tree.grow()
+        self.assertEqual(6, len(tree.steps))
+
+
+class TestIterApply(unittest.TestCase):
+    def test_same_results_as_apply(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        sequents = (
+            Sequent(ant=(Conjunction(p, q), r), con=p),
+            Sequent(ant=(Disjunction(p, q), r), con=p),
+            Sequent(ant=(Conditional(p, q), r), con=p),
+            Sequent(ant=r, con=(Conjunction(p, q), p)),
+            Sequent(ant=r, con=(Disjunction(p, q), p)),
+            Sequent(ant=r, con=(Conditional(p, q), p)),
+            Sequent(ant=Negation(p), con=Negation(q)),
+            Sequent(ant=Universal('x', Atom('P<x>')), con=Existential('x', Atom('P<x>'))),
+        )
+        for rule_type in ('add', 'mul'):
+            with patch('settings.__Settings.get_rule', return_value=rule_type):
+                table = RuleTable.from_settings()
+            for sequent in sequents:
+                with self.subTest(i=(rule_type, str(sequent))):
+                    rule = table.rule_for(sequent, names={'alice', 'bob'})
+                    self.assertEqual(rule.apply(), tuple(rule.iter_apply()))
+
+    def test_splits_are_made_as_asked_for(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            table = RuleTable.from_settings()
+        sequent = Sequent(ant=(p, q, r), con=Conjunction(p, q))
+        rule = table.rule_for(sequent, prune=True)
+        decompositions = rule.iter_apply()
+        first = next(decompositions)
+        self.assertEqual(0, rule.pruned)
+        rest = tuple(decompositions)
+        self.assertEqual(8 - len(rest) - 1, rule.pruned)
+        self.assertEqual(table.rule_for(sequent, prune=True).apply(), (first,) + rest)
+
+    def test_splits_build_each_parent_once(self) -> None:
+        p, q, r = Atom('p'), Atom('q'), Atom('r')
+        with patch('settings.__Settings.get_rule', return_value='mul'):
+            table = RuleTable.from_settings()
+        for sequent in (Sequent(ant=(p, q), con=(Conjunction(p, q), r)),
+                        Sequent(ant=(Conditional(p, q), r), con=(p, q))):
+            rule = table.rule_for(sequent)
+            with self.subTest(i=str(sequent)), \
+                    patch.object(Sequent, '__post_init__', autospec=True,
+                                 side_effect=Sequent.__post_init__) as post_init:
+                pairs = rule.apply()
+                self.assertEqual(8, len(pairs))
+                self.assertEqual(16, post_init.call_count)
+
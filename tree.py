@@ -21,13 +21,47 @@ about).
 
 Trees initialization signature is:
 Tree(root: str, is_grown: bool = False, names: list[str] = [])
+
+Trees created with prune=True (which their parents pass on) leave out
+branches of two-parent multiplicative rules in which a parent can't be
+closed, and count them in .pruned (see rules.get_rule).
+
+Trees created with a TreeMemo share it with their parents, and any
+parent whose sequent has already been seen by the memo (with the same
+names and rules) is the tree that was made for it the first time
+rather than a copy, so it is only grown once. Trees grown this way are
+directed acyclic graphs rather than trees proper.
+
+Trees grown with a rule table which compresses (see rules.RuleTable)
+apply each run of invertible one-parent rules in one step: such a tree
+has a single parent, the sequent at the end of the run, and records
+the names of the rules applied on the way in .steps. Tree.chain()
+gives the sequents in between, and Tree.expand() a copy of the tree
+with a tree for each of them.
+
+Trees grown with .grow(lazy=True) make the branches of rules with
+more than one (see rules.branching) only as they are reached, in a
+LazyBranches sequence. Only asking for their number, or measuring the
+tree, makes them all.
+
+Tree.is_provable() answers whether a tree has a split whose atomic
+sequents are all axioms (identities, by default) while growing as
+little of the tree as it can.
+
+Measuring a tree (.height(), .width(), .node_count() or .leaf_count())
+grows it fully, after which its measurements are kept, so asking again
+costs nothing.
 """
 
-__all__ = ['Tree']
+__all__ = ['Tree', 'TreeMemo', 'LazyBranches', 'in_base', 'is_identity']
 
+import functools
 import itertools
+import math
+import random
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Generator, Self
+from typing import Callable, Generator, Iterable, Iterator, NamedTuple, Self, Sequence
 
 import rules
 from sequent import Sequent
@@ -71,6 +105,91 @@ class Branch:
         return len(self.leaves)
 
 
+class LazyBranches(Sequence):
+    """
+    The branches of a tree grown lazily, each made from the next
+    decomposition of its rule (see rules.Rule.iter_apply) the first time
+    it is reached, and kept after that. done, if given, is called once
+    the decompositions run out.
+
+    Lazy branches compare equal to tuples of the same branches, and
+    pickle as one.
+    """
+    __slots__ = 'made', '_decompositions', '_make_branch', '_done'
+
+    def __init__(self, decompositions: Iterator[tuple[Sequent, ...]],
+                 make_branch: Callable[[tuple[Sequent, ...]], Branch],
+                 done: Callable[[], None] = None) -> None:
+        self.made: list[Branch] = []
+        self._decompositions = decompositions
+        self._make_branch = make_branch
+        self._done = done
+
+    def __repr__(self) -> str:
+        more = ', ...' if self._decompositions is not None else ''
+        return f'LazyBranches({self.made!r}{more})'
+
+    def __reduce__(self) -> tuple:
+        return tuple, (tuple(self),)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (tuple, LazyBranches)):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __bool__(self) -> bool:
+        # Rules always have at least one result.
+        return True
+
+    def __len__(self) -> int:
+        while self._make_next():
+            pass
+        return len(self.made)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            return tuple(self)[index]
+        while index >= len(self.made) and self._make_next():
+            pass
+        return self.made[index]
+
+    def __iter__(self) -> Iterator[Branch]:
+        index = 0
+        while index < len(self.made) or self._make_next():
+            yield self.made[index]
+            index += 1
+
+    @property
+    def is_complete(self) -> bool:
+        """Return whether every branch has been made."""
+        return self._decompositions is None
+
+    def _make_next(self) -> bool:
+        """Make the next branch, returning False if there are none left."""
+        if self._decompositions is None:
+            return False
+        try:
+            decomposition = next(self._decompositions)
+        except StopIteration:
+            self._decompositions = None
+            if self._done is not None:
+                self._done()
+            return False
+        self.made.append(self._make_branch(decomposition))
+        return True
+
+
+class TreeMetrics(NamedTuple):
+    """
+    Measurements of a fully grown tree, which can't change once it is.
+    """
+    height: int
+    width: int
+    nodes: int
+    leaves: int
+    splits: int
+
+
 @dataclass(slots=True, order=True)
 class Tree:
     """
@@ -79,13 +198,29 @@ class Tree:
     root: Sequent
     grow_on_creation: bool = field(default=False, repr=False)
     names: set[str] = field(default_factory=set)
-    branches: tuple[Branch | None, ...] = ()
+    branches: tuple[Branch | None, ...] | LazyBranches = ()
+    prune: bool = field(default=False, repr=False, compare=False)
+    pruned: int = field(default=0, init=False, repr=False, compare=False)
+    memo: 'TreeMemo' = field(default=None, repr=False, compare=False)
+    rule_table: rules.RuleTable = field(default=None, repr=False, compare=False)
+    steps: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    _metrics: 'TreeMetrics' = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.names.update(self.root.names)
         if self.grow_on_creation:
             self.grow()
 
+    def __getstate__(self) -> dict:
+        # The memo is only used while growing and can be much bigger
+        # than the tree, so it is left behind.
+        return {name: getattr(self, name) for name in self.__slots__ if name != 'memo'}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.memo = None
+
     @property
     def is_grown(self) -> bool:
         """Return whether this tree's .grow() method has been called."""
@@ -107,39 +242,100 @@ class Tree:
         Return the proof height of this tree. In other words, the
         greatest number of steps it takes to fully decompose a branch.
         """
-        if not self.is_grown:
-            self.grow()
-        if self.root.is_atomic:
-            return 1
-        return max(parent.height() for parent in self.parents) + 1
+        return self._measure().height
 
     def width(self) -> int:
         """
         Returns the number of atoms this tree contains.
         """
-        if not self.is_grown:
-            self.grow()
-        if self.root.is_atomic:
-            return 1
+        return self._measure().width
+
+    def node_count(self) -> int:
+        """
+        Return the number of trees in this one, including itself, with
+        shared trees counted each time they appear.
+        """
+        return self._measure().nodes
 
-        return max(sum(parent.width() for parent in branch) for branch in self.branches)
+    def leaf_count(self) -> int:
+        """
+        Return the number of atomic trees in this one, with shared trees
+        counted each time they appear.
+        """
+        return self._measure().leaves
 
-    def sequents(self) -> Generator[Sequent, None, None]:
-        """ Yields from sequents in self. """
-        if not self.is_grown:
-            self.grow()
-        if self.root.is_atomic:
-            yield self.root
-        else:
-            yield from (parent.sequents() for branch in self.branches for parent in branch)
+    def count_splits(self) -> int:
+        """
+        Return the number of trees self.split() would return, without
+        building any of them.
+        """
+        return self._measure().splits
+
+    def _measure(self) -> 'TreeMetrics':
+        """
+        Return this tree's metrics, growing and measuring it (and any
+        trees in it not yet measured) if need be.
+        """
+        if self._metrics is not None:
+            return self._metrics
+        for tree in self._post_order(skip_measured=True):
+            if tree._metrics is not None:
+                continue
+            if tree.root.is_atomic:
+                tree._metrics = TreeMetrics(height=1, width=1, nodes=1, leaves=1, splits=1)
+                continue
+            parents = [parent._metrics for parent in tree.parents]
+            tree._metrics = TreeMetrics(
+                height=max(metrics.height for metrics in parents) + 1,
+                width=max(
+                    sum(parent._metrics.width for parent in branch)
+                    for branch in tree.branches
+                ),
+                nodes=sum(metrics.nodes for metrics in parents) + 1,
+                leaves=sum(metrics.leaves for metrics in parents),
+                splits=sum(
+                    math.prod(parent._metrics.splits for parent in branch)
+                    for branch in tree.branches
+                )
+            )
+        return self._metrics
 
-    def grow(self):
+    def sequents(self, by_branch: bool = False
+                 ) -> Generator[Sequent | tuple[tuple[int, ...], Sequent], None, None]:
+        """
+        Yield each atomic sequent in this tree, left to right, growing
+        trees only as they are reached.
+
+        If by_branch is True, yield each with the indices of the branch
+        taken at every tree on the way down to it. Since sequents come
+        in order, they can be grouped by branch as they arrive, e.g.
+        >>> for index, group in itertools.groupby(tree.sequents(True),
+        ...                                       key=lambda pair: pair[0][:1]):
+        ...     # group has the sequents in tree.branches[index[0]]
+        """
+        stack = [((), self)]
+        while stack:
+            path, tree = stack.pop()
+            tree.grow()
+            if tree.root.is_atomic:
+                yield (path, tree.root) if by_branch else tree.root
+                continue
+            for index in reversed(range(len(tree.branches))):
+                branch_path = path + (index,)
+                stack.extend((branch_path, parent) for parent in reversed(tree.branches[index].leaves))
+
+    def grow(self, lazy: bool = False):
         """
         Solve the root, then recursively solve each branch.
+
+        If lazy is True, and the rule for the root gives more than one
+        branch, the branches are a LazyBranches, made as they are
+        reached, and .pruned is only set once the last has been made.
         """
         # No operation if tree is already grown.
         if self.branches:
             return
+        self._metrics = None
 
         # Atomic root means no branches, but this must be distinguished
         # from a tree that has not been grown. We mark this with (None,)
@@ -147,72 +343,411 @@ class Tree:
             self.branches = (None,)
             return
 
-        rule = rules.get_rule(self.root, names=self.names)
-        self.branches = _apply_decomposition(rule)
+        # Trees without a rule table take one from the settings when they
+        # are first grown, and share it with their parents.
+        if self.rule_table is None:
+            self.rule_table = rules.RuleTable.from_settings()
+        rule = self.rule_table.rule_for(self.root, names=self.names, prune=self.prune)
+        if self.rule_table.compress and rules.is_invertible_step(rule):
+            self.steps, sequent = _apply_invertible_steps(
+                rule, self.rule_table, names=self.names, prune=self.prune
+            )
+            self.branches = _branches_from_decomp_result(
+                ((sequent,),), prune=self.prune, memo=self.memo, rule_table=self.rule_table
+            )
+            return
+        if lazy and rules.branching(rule) > 1:
+            def record_pruned() -> None:
+                self.pruned = getattr(rule, 'pruned', 0)
+
+            make_branch = functools.partial(
+                _branch_from_decomp_result, prune=self.prune, memo=self.memo,
+                rule_table=self.rule_table
+            )
+            self.branches = LazyBranches(rule.iter_apply(), make_branch, done=record_pruned)
+            return
+        self.branches = _apply_decomposition(
+            rule, prune=self.prune, memo=self.memo, rule_table=self.rule_table
+        )
+        self.pruned = getattr(rule, 'pruned', 0)
+
+    def chain(self) -> list[Sequent]:
+        """
+        Return the sequents from the root of this tree up to (but not
+        including) its parent: the root, then the result of each rule in
+        self.steps but the last. Uncompressed trees give just the root.
+        """
+        sequents = [self.root]
+        for _ in self.steps[1:]:
+            rule = self.rule_table.rule_for(sequents[-1], names=self.names, prune=self.prune)
+            (sequent,), = rule.apply()
+            sequents.append(sequent)
+        return sequents
+
+    def expand(self) -> Self:
+        """
+        Return a fully grown copy of this tree in which every run of
+        steps taken at once (see .steps) is a tree for each step, as if
+        it had been grown without compressing.
+        """
+        rule_table = self.rule_table
+        if rule_table is not None:
+            rule_table = rule_table.with_compression(False)
+        copies = {}
+        for tree in self._post_order():
+            if tree.root.is_atomic:
+                branches = (None,)
+            else:
+                branches = tuple(
+                    Branch(tuple(copies[id(parent)] for parent in branch))
+                    for branch in tree.branches
+                )
+            # The last sequent of the chain is the first one built, and
+            # each earlier one has the one after it as its parent. Like
+            # the parents of any tree, those after the first only start
+            # out with the names in their own sequents.
+            chain = tree.chain()
+            for i, sequent in reversed(list(enumerate(chain))):
+                names = set(tree.names) if i == 0 else set()
+                copy = Tree(sequent, names=names, branches=branches,
+                            prune=tree.prune, rule_table=rule_table)
+                branches = Branch((copy,)),
+            copy.pruned = tree.pruned
+            copies[id(tree)] = copy
+        return copies[id(self)]
+
+    def total_pruned(self) -> int:
+        """
+        Return the number of branches left out of this tree and all the
+        trees in it by pruning (see rules.get_rule).
+        """
+        return sum(tree.pruned for tree in self._post_order())
 
     def split(self) -> list[Self]:
-        if not self.is_grown:
-            self.grow()
+        """
+        Return a tree for each way of choosing one branch at every
+        sequent in this one, in order.
+        """
+        splits = {}
+        for tree in self._post_order():
+            # Atomic trees have no parents and therefore cannot be split.
+            if tree.root.is_atomic:
+                splits[id(tree)] = [tree]
+                continue
+            result = []
+            for branch in tree.branches:
+                split_parents = _split_branch_parents(branch, splits)
+                result.extend(tree._new_trees_from_split_parents(split_parents))
+            splits[id(tree)] = result
+        return splits[id(self)]
+
+    def split_at(self, index: int) -> Self:
+        """
+        Return self.split()[index] without building the splits before
+        it (or any after it).
+        """
+        count = self.count_splits()
+        if not 0 <= index < count:
+            raise IndexError(f'Tree has {count} splits, not {index + 1}.')
+
+        # Work out, from the root up, which branch each tree in the split
+        # takes and which split of each of its parents that branch needs,
+        # then build the trees in the opposite order.
+        jobs = [(self, index)]
+        parent_jobs: list[list[int] | None] = []
+        for tree, index in jobs:
+            if tree.root.is_atomic:
+                parent_jobs.append(None)
+                continue
+            for branch in tree.branches:
+                counts = [parent.count_splits() for parent in branch]
+                if index < (size := math.prod(counts)):
+                    break
+                index -= size
+            # The last parent's split varies fastest, as in itertools.product.
+            indices = []
+            for count in reversed(counts):
+                index, remainder = divmod(index, count)
+                indices.append(remainder)
+            parent_jobs.append(list(range(len(jobs), len(jobs) + len(branch))))
+            jobs.extend(zip(branch, reversed(indices)))
+
+        results: list[Tree | None] = [None] * len(jobs)
+        for i in reversed(range(len(jobs))):
+            tree = jobs[i][0]
+            if parent_jobs[i] is None:
+                results[i] = tree
+                continue
+            group = tuple(results[j] for j in parent_jobs[i])
+            results[i] = next(tree._new_trees_from_split_parents([group]))
+        return results[0]
+
+    def iter_splits(self, limit: int = None) -> Generator[Self, None, None]:
+        """
+        Lazily yield the trees in self.split(), in order, stopping after
+        limit trees if limit is given.
+        """
+        count = self.count_splits()
+        if limit is not None:
+            count = min(count, limit)
+        for index in range(count):
+            yield self.split_at(index)
 
-        # Atomic trees have no parents and therefore cannot be split.
-        if self.root.is_atomic:
-            return [self]
+    def sample_splits(self, k: int, rng: random.Random = None) -> list[Self]:
+        """
+        Return k distinct trees from self.split() chosen at random (or
+        all of them if there are fewer than k), in the order they
+        appear there.
+        """
+        if rng is None:
+            rng = random.Random()
+        count = self.count_splits()
+        if k >= count:
+            return list(self.iter_splits())
+        # random.sample can't take ranges longer than sys.maxsize, which
+        # splits easily outnumber.
+        indices = set()
+        while len(indices) < k:
+            indices.add(rng.randrange(count))
+        return [self.split_at(index) for index in sorted(indices)]
+
+    def is_provable(self, axiom: Callable[[Sequent], bool] = None) -> bool:
+        """
+        Return whether some split of this tree has only atomic sequents
+        that are axioms, i.e. for which axiom (is_identity by default)
+        returns True.
+
+        Trees are searched depth-first and grown (lazily, see .grow())
+        only as they are reached: a tree stops at the first of its
+        branches whose parents are all provable, and a branch stops at
+        the first of its parents that isn't, so most of a large tree is
+        usually never grown, nor most of its branches made.
+        Trees with the same sequent and names are only searched once.
+
+        Pruned trees may be missing splits that close by anything other
+        than identity, so they can only be searched for identities.
+        """
+        if axiom is None:
+            axiom = is_identity
+        if self.prune and axiom is not is_identity:
+            raise ValueError('Pruned trees can only be searched for identities.')
+
+        def search(tree: Tree) -> Generator[Tree, bool, bool]:
+            # Yields trees whose provability it needs, and is sent back
+            # the answer.
+            tree.grow(lazy=True)
+            if tree.root.is_atomic:
+                return axiom(tree.root)
+            for branch in tree.branches:
+                for parent in branch:
+                    if not (yield parent):
+                        break
+                else:
+                    return True
+            return False
+
+        results: dict[tuple[Sequent, frozenset[str]], bool] = {}
+        stack = [(self, search(self))]
+        result = None
+        while True:
+            tree, searching = stack[-1]
+            try:
+                parent = searching.send(result)
+            except StopIteration as stop:
+                stack.pop()
+                result = results[tree.root, frozenset(tree.names)] = stop.value
+                if not stack:
+                    return result
+                continue
+            try:
+                result = results[parent.root, frozenset(parent.names)]
+            except KeyError:
+                stack.append((parent, search(parent)))
+                result = None
+
+    def grow_all(self, order: str = 'depth') -> Counter:
+        """
+        Grow this tree and every tree in it, working through them
+        'depth'-first or 'breadth'-first, without recursion.
 
-        result = []
-        for branch in self.branches:
-            split_parents: list[tuple[Tree]] = _split_branch_parents(branch)
-            for tree in self._new_trees_from_split_parents(split_parents):
-                result.append(tree)
-        return result
+        Returns a Counter of the 'nodes' (trees) visited, how many of
+        them were 'grown' by this call, how many are 'leaves' (atomic),
+        and how many times a tree already visited was met again as the
+        parent of another one ('shared', see TreeMemo).
+        """
+        if order not in ('depth', 'breadth'):
+            raise ValueError(f'Parameter "order" must be "depth" or "breadth", not {order}.')
+
+        counts = Counter(nodes=0, grown=0, leaves=0, shared=0)
+        worklist = deque([self])
+        take = worklist.pop if order == 'depth' else worklist.popleft
+        seen = {id(self)}
+        while worklist:
+            tree = take()
+            counts['nodes'] += 1
+            if not tree.is_grown:
+                tree.grow()
+                counts['grown'] += 1
+            if tree.root.is_atomic:
+                counts['leaves'] += 1
+                continue
+
+            parents = list(tree.parents)
+            if order == 'depth':
+                # So that the leftmost parent is taken first.
+                parents.reverse()
+            for parent in parents:
+                if id(parent) in seen:
+                    counts['shared'] += 1
+                    continue
+                seen.add(id(parent))
+                worklist.append(parent)
+        return counts
+
+    def _post_order(self, skip_measured: bool = False) -> Generator[Self, None, None]:
+        """
+        Grow and yield each tree in this one, parents before the trees
+        they're parents of, and each tree once even if it is shared. If
+        skip_measured is True, the parents of trees that have already
+        been measured are left out.
+        """
+        seen = set()
+        stack = [(self, False)]
+        while stack:
+            tree, finished = stack.pop()
+            if finished:
+                yield tree
+                continue
+            if id(tree) in seen:
+                continue
+            seen.add(id(tree))
+            if skip_measured and tree._metrics is not None:
+                yield tree
+                continue
+            tree.grow()
+            stack.append((tree, True))
+            if not tree.root.is_atomic:
+                stack.extend((parent, False) for parent in tree.parents)
 
     def _new_trees_from_split_parents(self, split_parents) -> Generator[Self, None, None]:
         for group in split_parents:
             yield Tree(
                 root=self.root,
                 names=self.names,
-                branches=(Branch(group),)
+                branches=(Branch(group),),
+                prune=self.prune,
+                rule_table=self.rule_table,
+                steps=self.steps
             )
 
 
-def _apply_decomposition(rule: rules.Rule) -> tuple[Branch]:
-    decomposition_result: rules.decomp_result = rule.apply()
-    return _branches_from_decomp_result(decomposition_result)
+class TreeMemo:
+    """
+    Table of the trees made for each sequent, so that identical
+    subproblems are grown once and shared between all the trees (and
+    roots) that contain them.
+
+    Trees are keyed on their sequent, their names, whether they prune,
+    and the memo's rule table (by default, the rules set when the memo
+    was made), which the trees are grown with.
+    """
+    def __init__(self, rule_table: rules.RuleTable = None) -> None:
+        if rule_table is None:
+            rule_table = rules.RuleTable.from_settings()
+        self.table: dict[tuple, Tree] = {}
+        self.rule_table = rule_table
+        self.hits = 0
 
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def tree(self, sequent: Sequent, names: set[str] = None, prune: bool = False) -> Tree:
+        """
+        Return the tree for sequent with names, making it if need be.
+        """
+        names = sequent.names if names is None else names | sequent.names
+        key = sequent, frozenset(names), prune, self.rule_table
+        try:
+            tree = self.table[key]
+        except KeyError:
+            tree = self.table[key] = Tree(
+                sequent, names=set(names), prune=prune, memo=self, rule_table=self.rule_table
+            )
+        else:
+            self.hits += 1
+        return tree
+
+    def clear(self) -> None:
+        self.table.clear()
+        self.hits = 0
 
-def _branches_from_decomp_result(decomposition_result: rules.decomp_result) -> tuple[Branch]:
+
+def is_identity(sequent: Sequent) -> bool:
+    """
+    Return whether some proposition is in both sequent's antecedent and
+    its consequent.
+    """
+    return any(prop in sequent.con for prop in sequent.ant)
+
+
+def in_base(base: Iterable[Sequent]) -> Callable[[Sequent], bool]:
+    """
+    Return an axiom condition (see Tree.is_provable) which holds for
+    identities and for the sequents in base.
+    """
+    base = frozenset(base)
+    return lambda sequent: is_identity(sequent) or sequent in base
+
+
+def _apply_decomposition(rule: rules.Rule, prune: bool = False, memo: TreeMemo = None,
+                         rule_table: rules.RuleTable = None) -> tuple[Branch]:
+    decomposition_result: rules.decomp_result = rule.apply()
+    return _branches_from_decomp_result(decomposition_result, prune, memo, rule_table)
+
+
+def _apply_invertible_steps(rule: rules.Rule, rule_table: rules.RuleTable,
+                            names: set[str] = None, prune: bool = False
+                            ) -> tuple[tuple[str, ...], Sequent]:
+    # Apply rule, then the rule for its result for as long as that is an
+    # invertible step, and return the names of the rules applied with
+    # the last result.
+    steps = []
+    while True:
+        steps.append(type(rule).__name__)
+        (sequent,), = rule.apply()
+        if sequent.is_atomic:
+            break
+        rule = rule_table.rule_for(sequent, names=names, prune=prune)
+        if not rules.is_invertible_step(rule):
+            break
+    return tuple(steps), sequent
+
+
+def _branches_from_decomp_result(decomposition_result: rules.decomp_result,
+                                 prune: bool = False, memo: TreeMemo = None,
+                                 rule_table: rules.RuleTable = None) -> tuple[Branch]:
     branches: tuple = ()
     for decomposition in decomposition_result:
-        branches += (_branch_from_decomp_result(decomposition),)
+        branches += (_branch_from_decomp_result(decomposition, prune, memo, rule_table),)
     return branches
 
 
-def _branch_from_decomp_result(decomposition: tuple[Sequent, ...]) -> Branch:
+def _branch_from_decomp_result(decomposition: tuple[Sequent, ...], prune: bool = False,
+                               memo: TreeMemo = None,
+                               rule_table: rules.RuleTable = None) -> Branch:
     branch = Branch()
     for sequent in decomposition:
-        branch += (Tree(sequent,),)
+        if memo is None:
+            branch += (Tree(sequent, prune=prune, rule_table=rule_table),)
+        else:
+            branch += (memo.tree(sequent, prune=prune),)
     return branch
 
 
-def _split_branch_parents(branch: Branch) -> list[tuple[Tree] | tuple[Tree, Tree]]:
-    if len(branch) == 1:
-        return _split_one_parent_branch(branch)
-    elif len(branch) == 2:
-        return _split_two_parent_branch(branch)
-    else:
+def _split_branch_parents(branch: Branch, splits: dict[int, list[Tree]]
+                          ) -> list[tuple[Tree] | tuple[Tree, Tree]]:
+    if len(branch) > 2:
         raise NotImplementedError('Branches with length > 2 are not currently supported.')
-
-
-def _split_one_parent_branch(branch: Branch) -> list[tuple[Tree]]:
-    return [(tree,) for tree in branch[0].split()]
-
-
-def _split_two_parent_branch(branch: Branch) -> list[tuple[Tree, Tree]]:
-    return [
-        (left, right)
-        for left, right in itertools.product(
-            branch[0].split(),  # split left parent
-            branch[1].split()  # split right parent
-        )
-    ]
-
-
+    # Every combination of the splits of each parent, where splits maps
+    # the id of each parent to its splits.
+    return list(itertools.product(*(splits[id(tree)] for tree in branch)))